@@ -110,6 +110,8 @@ LED_UPLOAD_BLINK_INTERVAL = 0.5  # Seconds (on/off each 0.5s = 1.0s cycle)
 TTS_RATE = 150  # Words per minute
 TTS_VOLUME = 0.8  # 0.0 to 1.0
 SPEAKER_DEVICE = "hw:1,0"  # USB speaker device
+# Synthesized speech is cached here as WAV and replayed with aplay
+TTS_CACHE_DIR = Path.home() / ".cache" / "recorder_tts"
 
 # Audio Input Configuration (for recording)
 # Using PulseAudio default source (camera microphone)
@@ -147,6 +149,12 @@ NETWORK_CHECK_INTERVAL = 30  # Check internet every 30 seconds (configurable)
 NETWORK_CHECK_TIMEOUT = 3  # Timeout for connectivity check (seconds)
 NETWORK_CHECK_HOST = "8.8.8.8"  # Google DNS - reliable external host
 NETWORK_CHECK_PORT = 53  # DNS port
+NETWORK_CHECK_CACHE_TTL = 15  # Reuse last result for this long (seconds)
+# All (host, port) targets probed in parallel - online if ANY answers
+NETWORK_CHECK_TARGETS = [
+    (NETWORK_CHECK_HOST, NETWORK_CHECK_PORT),
+    ("1.1.1.1", 53),  # Cloudflare DNS - independent second provider
+]
 
 # Video Settings
 VIDEO_WIDTH = 1920
@@ -177,11 +185,16 @@ DIR_CORRUPTED = "corrupted"
 # Video File Naming
 VIDEO_FILENAME_PREFIX = "recording"
 VIDEO_FILENAME_EXTENSION = ".mp4"
+# strftime format - applied once per recording when the file is named
 VIDEO_FILENAME_PATTERN = (
     f"{VIDEO_FILENAME_PREFIX}_%Y-%m-%d_%H%M%S{VIDEO_FILENAME_EXTENSION}"
 )
 METADATA_DB_NAME = "video_metadata.db"
 
+# Pending recordings directory, joined once for the recorder's per-recording
+# filename. The storage layer builds its own paths from an injectable base
+PENDING_DIR = STORAGE_BASE_PATH / DIR_PENDING
+
 # Space Management (in bytes)
 MIN_FREE_SPACE_BYTES = 5 * 1024 * 1024 * 1024  # 5 GB
 LOW_SPACE_WARNING_BYTES = 10 * 1024 * 1024 * 1024  # 10 GB
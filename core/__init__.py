@@ -4,6 +4,7 @@ Core utilities and modules.
 Public API:
     - check_internet_connectivity: Check if internet is available
     - get_network_status: Get human-readable network status
+    - NetworkMonitor: Background connectivity monitor with cached status
 
 Usage:
     from core.network import check_internet_connectivity
@@ -12,9 +13,14 @@ Usage:
         print("Internet available")
 """
 
-from core.network import check_internet_connectivity, get_network_status
+from core.network import (
+    NetworkMonitor,
+    check_internet_connectivity,
+    get_network_status,
+)
 
 __all__ = [
+    "NetworkMonitor",
     "check_internet_connectivity",
     "get_network_status",
 ]
@@ -3,25 +3,65 @@ Network Connectivity Checker
 
 Simple utility to check if internet connection is available.
 Uses socket connection to external host for reliability.
+
+NetworkMonitor runs the check on a background thread so callers read the
+last known status instead of blocking on network I/O.
 """
 
+import atexit
 import logging
 import socket
-from typing import Tuple
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
 
 from config.settings import (
-    NETWORK_CHECK_HOST,
-    NETWORK_CHECK_PORT,
+    NETWORK_CHECK_CACHE_TTL,
+    NETWORK_CHECK_INTERVAL,
+    NETWORK_CHECK_TARGETS,
     NETWORK_CHECK_TIMEOUT,
 )
 
 
-def check_internet_connectivity() -> bool:
+@dataclass
+class _CachedCheck:
+    """Last connectivity result and when it was taken."""
+
+    # time.monotonic() of the probe, None until the first probe completes
+    # WHY monotonic: wall-clock jumps (NTP sync at boot) must not expire/extend it
+    timestamp: Optional[float] = None
+    is_connected: bool = False
+
+
+# WHY: status queries between monitor ticks shouldn't each open a TCP socket
+_cache = _CachedCheck()
+
+# Resolved IP per check host (a host is absent until its first lookup works)
+# WHY: create_connection() applies its timeout per resolved address, so a
+# hostname with N records can block N x timeout; an IP literal blocks once
+_resolved: Dict[str, str] = {}
+
+# Probe threads, created on first multi-target check and reused afterwards
+# WHY a persistent pool: spawning threads every check costs more than the probe
+# The lock makes creation safe when the monitor and a direct check race
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def check_internet_connectivity(force: bool = False) -> bool:
     """
     Check if internet connection is available.
 
-    Attempts a socket connection to a reliable external host (Google DNS).
-    This indicates whether uploads and SSH access would be possible.
+    Attempts socket connections to reliable external hosts (Google and
+    Cloudflare DNS by default, see NETWORK_CHECK_TARGETS) in parallel and
+    reports online as soon as any one answers. This indicates whether
+    uploads and SSH access would be possible.
+    The result is reused for NETWORK_CHECK_CACHE_TTL seconds.
+
+    Args:
+        force: Bypass the cache and always probe the network
 
     Returns:
         True if internet is available, False otherwise
@@ -30,16 +70,133 @@ def check_internet_connectivity() -> bool:
         - Uses socket.create_connection() for speed and reliability
         - Non-blocking, respects timeout setting
         - Lightweight (~10ms per check when network available)
+        - Latency is the fastest target's, not the sum of all targets
         - Exceptions are caught and logged silently
     """
+    checked_at = _cache.timestamp
+    if (
+        not force
+        and checked_at is not None
+        and time.monotonic() - checked_at < NETWORK_CHECK_CACHE_TTL
+    ):
+        return _cache.is_connected
+
+    is_connected = _probe_connectivity()
+
+    _cache.is_connected = is_connected
+    _cache.timestamp = time.monotonic()
+    return is_connected
+
+
+def _resolve_check_host(host: str) -> str:
+    """
+    Resolve a check host to an IPv4 address, once per process.
+
+    Resolution is deferred to the first check rather than import time so an
+    offline boot doesn't stall importing this module on a DNS timeout.
+
+    Args:
+        host: Hostname or IP literal
+
+    Returns:
+        IP address string, or the host itself if it can't be resolved yet
+    """
+    ip = _resolved.get(host)
+    if ip is None:
+        try:
+            ip = socket.gethostbyname(host)
+        except OSError:
+            # DNS unavailable - retry resolution on the next check
+            return host
+        _resolved[host] = ip
+
+    return ip
+
+
+def _probe_connectivity() -> bool:
+    """
+    Probe every target in parallel (uncached).
+
+    Returns:
+        True as soon as any target accepts a connection, False if none do
+    """
+    if len(NETWORK_CHECK_TARGETS) == 1:
+        # Single target - no point paying for a thread hop
+        host, port = NETWORK_CHECK_TARGETS[0]
+        return _probe_target(host, port)
+
+    executor = _get_executor()
+    pending = {
+        executor.submit(_probe_target, host, port)
+        for host, port in NETWORK_CHECK_TARGETS
+    }
+
+    # Each probe enforces its own connect timeout, so this loop is bounded
+    # by roughly NETWORK_CHECK_TIMEOUT; the extra second is only a backstop
+    deadline = time.monotonic() + NETWORK_CHECK_TIMEOUT + 1
+    while pending:
+        done, pending = wait(
+            pending,
+            timeout=max(0.0, deadline - time.monotonic()),
+            return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            break  # Backstop deadline hit
+        if any(future.result() for future in done):
+            # Slower probes finish on their own within their timeout
+            for future in pending:
+                future.cancel()
+            return True
+
+    return False
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared probe pool, creating it on first use.
+
+    Returns:
+        Executor with one worker per check target
+    """
+    global _executor  # noqa: PLW0603 - lazily created module singleton
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=len(NETWORK_CHECK_TARGETS),
+                thread_name_prefix="NetworkProbe",
+            )
+        return _executor
+
+
+@atexit.register
+def _shutdown_executor() -> None:
+    """Release the probe pool at interpreter exit (without waiting)."""
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _probe_target(host: str, port: int) -> bool:
+    """
+    Open a TCP connection to one target.
+
+    Args:
+        host: Hostname or IP literal
+        port: TCP port
+
+    Returns:
+        True if the connection succeeded
+    """
     logger = logging.getLogger(__name__)
 
     try:
-        # Create a socket with timeout
-        socket.create_connection(
-            (NETWORK_CHECK_HOST, NETWORK_CHECK_PORT),
+        # Create a socket with timeout, closed as soon as it connects
+        with socket.create_connection(
+            (_resolve_check_host(host), port),
             timeout=NETWORK_CHECK_TIMEOUT,
-        )
+        ):
+            pass
         return True
     except (socket.timeout, OSError):
         # Network unavailable, timeout, or DNS lookup failed
@@ -66,3 +223,103 @@ def get_network_status() -> Tuple[bool, str]:
     is_connected = check_internet_connectivity()
     status = "Internet available" if is_connected else "No internet connection"
     return is_connected, status
+
+
+class NetworkMonitor:
+    """
+    Background internet connectivity monitor.
+
+    Probes the network every `interval` seconds on a daemon thread and keeps
+    the result in a plain attribute. is_online() is a lock-free read (a bool
+    rebind is atomic under the GIL), so the main loop never waits on a socket.
+
+    Example:
+        monitor = NetworkMonitor()
+        monitor.on_check = led.set_network_status
+        monitor.start()
+        if monitor.is_online():
+            ...
+        monitor.stop()
+    """
+
+    def __init__(self, interval: float = NETWORK_CHECK_INTERVAL):
+        """
+        Initialize network monitor (does not start the thread).
+
+        Args:
+            interval: Seconds between connectivity checks
+        """
+        self.logger = logging.getLogger(__name__)
+        self.interval = interval
+
+        # Last known status (False until the first check completes)
+        self._online = False
+
+        # Event callback - called after every check with the result
+        self.on_check: Optional[Callable[[bool], None]] = None
+
+        # WHY Event instead of sleep(): stop() wakes the worker immediately
+        # instead of waiting out the rest of a 30s interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background monitoring thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._monitor_worker,
+            daemon=True,
+            name="NetworkMonitor",
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the monitoring thread.
+
+        Args:
+            timeout: Max seconds to wait for the thread to exit
+        """
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def is_online(self) -> bool:
+        """
+        Get last known connectivity status (no I/O).
+
+        Returns:
+            True if the most recent check reached the internet
+        """
+        return self._online
+
+    def _monitor_worker(self) -> None:
+        """Check connectivity every interval until stopped."""
+        self.logger.info("Network monitor thread started")
+
+        while not self._stop_event.is_set():
+            try:
+                # Probes unless another caller checked within the cache TTL
+                # (shorter than the interval), so the status stays fresh
+                is_connected = check_internet_connectivity()
+                self._online = is_connected
+
+                if self.on_check:
+                    self.on_check(is_connected)
+
+                # Log state for debugging
+                if is_connected:
+                    self.logger.debug("Internet: available")
+                else:
+                    self.logger.debug("Internet: unavailable")
+
+            except Exception as e:
+                self.logger.error(f"Network monitor error: {e}", exc_info=True)
+
+            self._stop_event.wait(self.interval)
+
+        self.logger.info("Network monitor thread stopped")
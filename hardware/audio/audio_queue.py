@@ -17,8 +17,10 @@ SOLID Principles:
 import logging
 import queue
 import threading
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
 
+from hardware.constants import THREAD_SHUTDOWN_TIMEOUT
 from hardware.interfaces.tts_interface import TTSInterface
 
 
@@ -37,8 +39,33 @@ class AudioQueue:
         audio_queue = AudioQueue(tts)
         audio_queue.play("Hello")  # Returns immediately
         audio_queue.play("World")  # Queued, plays after "Hello"
+        audio_queue.stop()  # When done
+
+    The owner must call stop(); there is no __del__. AudioController does it
+    from cleanup() and from its weakref.finalize safety net.
+    WHY no __del__: the running worker references the queue, so it could
+    only fire at interpreter exit, where it repeated the owner's stop() and
+    joined the worker a second time
     """
 
+    # WHY __slots__: fixed attribute set, no per-instance __dict__, and the
+    # worker/status reads become direct slot loads instead of dict lookups
+    __slots__ = (
+        "_current_message",
+        "_idle_event",
+        "_idle_lock",
+        "_is_playing",
+        "_last_enqueued",
+        "_message_queue",
+        "_muted",
+        "_pending",
+        "_prewarm",
+        "_worker_running",
+        "_worker_thread",
+        "logger",
+        "tts_engine",
+    )
+
     def __init__(self, tts_engine: TTSInterface):
         """
         Initialize audio queue.
@@ -54,8 +81,11 @@ class AudioQueue:
         self.tts_engine = tts_engine
 
         # Message queue (thread-safe FIFO)
-        # queue.Queue is thread-safe - can add/remove from multiple threads
-        self._message_queue: queue.Queue[str] = queue.Queue()
+        # WHY SimpleQueue over queue.Queue: C-implemented, one lock per put/get
+        #   and no task_done()/join() bookkeeping - idle tracking is done by
+        #   _pending/_idle_event below, so those features would be dead weight
+        # None is a wake-up sentinel put by stop()/prewarm(), never a message
+        self._message_queue: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
 
         # Worker thread control
         self._worker_thread: Optional[threading.Thread] = None
@@ -65,6 +95,28 @@ class AudioQueue:
         self._is_playing = False
         self._current_message: Optional[str] = None
 
+        # Muted: play() drops messages (one attribute read, nothing queued)
+        self._muted = False
+
+        # Idle tracking for wait_until_idle()
+        # WHY an Event: waiters wake the moment the last message finishes
+        #   instead of polling _is_playing every 100ms
+        # _pending counts queued + playing messages (guarded by _idle_lock)
+        self._pending = 0
+        self._idle_lock = threading.Lock()
+        self._idle_event = threading.Event()
+        self._idle_event.set()
+
+        # Text of the newest message still queued or being spoken (guarded
+        # by _idle_lock), None once the queue has drained and it finished
+        # WHY: SimpleQueue can't peek at its tail, and enqueue() uses this to
+        #   coalesce a repeat of a message that is queued or playing right now
+        self._last_enqueued: Optional[str] = None
+
+        # Texts to pre-render with the TTS engine while the queue is idle
+        # (see prewarm()); deque append/popleft are atomic, no lock needed
+        self._prewarm: Deque[str] = deque()
+
         # Start worker thread
         self._start_worker()
 
@@ -104,46 +156,43 @@ class AudioQueue:
         2. Speak the message (blocks until complete)
         3. Repeat
 
-        The queue.get() with timeout allows us to check if we should stop.
+        stop() puts a None sentinel to wake the blocked get() for shutdown.
         """
         self.logger.debug("Worker thread started")
 
         while self._worker_running:
             try:
-                # WHY use queue.get(timeout=1.0)?
+                # WHY a blocking get() with no timeout?
                 # Context: We need to be able to stop the worker thread when
-                #   shutdown() is called. Without a timeout, queue.get() blocks
-                #   forever waiting for a message, and we can't check
-                #   _worker_running flag.
+                #   stop() is called. Instead of waking every second to poll
+                #   the _worker_running flag, stop() clears the flag and puts
+                #   a None sentinel, which wakes get() immediately.
                 #
-                # Why 1.0 seconds?
-                #   - Too short (0.1s): Wastes CPU checking flag repeatedly,
-                #     more context switches
-                #   - Too long (10s): Shutdown takes too long when worker is
-                #     idle
-                #   - 1.0s: Good balance - responsive shutdown, minimal CPU
-                #     waste
-                #
-                # Pattern: This is a standard "cooperative shutdown" pattern
-                #   with queues. When no message available, Empty exception
-                #   fires, we loop back and check flag. When message available,
-                #   we wake up immediately (don't wait full 1s).
-                text = self._message_queue.get(timeout=1.0)
+                # Pattern: "poison pill" shutdown - an idle worker sleeps in
+                #   get() and costs no CPU until real work or shutdown arrives
+                # Idle time goes to pre-rendering, one phrase per pass, so a
+                # real message waits behind at most one render
+                if self._prewarm and self._message_queue.empty():
+                    self.tts_engine.prerender(self._prewarm.popleft())
+                    continue
+
+                text = self._message_queue.get()
+                if text is None:
+                    # Wake-up sentinel from stop()/prewarm() - loop re-checks
+                    # the flag and any pending pre-renders
+                    self._release_last_enqueued()
+                    continue
 
                 # We have a message - speak it
                 self._speak_message(text)
 
-                # WHY call task_done()?
-                # Context: queue.join() blocks until all items are "done".
-                #   Callers use wait_until_idle() to know when all queued
-                #   messages finished playing. Without task_done(),
-                #   wait_until_idle() would hang forever.
-                self._message_queue.task_done()
-
-            except queue.Empty:
-                # No message in queue within timeout window - loop continues
-                # to check if we should stop
-                continue
+                # Only now may the same text be queued again
+                self._release_last_enqueued()
+
+                # WHY mark done: wait_until_idle() waiters are released once
+                #   every queued message has been spoken or cleared
+                self._mark_done(1)
+
             except Exception as e:
                 # Never let worker crash - just log and continue
                 # This prevents one bad message from killing the entire audio
@@ -152,6 +201,12 @@ class AudioQueue:
 
         self.logger.debug("Worker thread stopped")
 
+    def _release_last_enqueued(self) -> None:
+        """Stop coalescing once nothing is queued behind the worker."""
+        with self._idle_lock:
+            if self._message_queue.empty():
+                self._last_enqueued = None
+
     def _speak_message(self, text: str) -> None:
         """
         Speak a single message.
@@ -166,7 +221,8 @@ class AudioQueue:
             self._is_playing = True
             self._current_message = text
 
-            self.logger.debug(f"Speaking: '{text[:30]}...'")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Speaking: '{text[:30]}...'")
 
             # This blocks until speech completes
             self.tts_engine.speak(text)
@@ -182,7 +238,9 @@ class AudioQueue:
         Queue text for speech playback.
 
         This returns IMMEDIATELY - speech happens in background.
-        Messages are played in order they're queued.
+        Messages are played in order they're queued. A message identical to
+        the last one queued is dropped (coalesced) while that one is still
+        waiting or playing.
 
         Args:
             text: Text to speak
@@ -192,17 +250,75 @@ class AudioQueue:
             audio_queue.play("Second message")  # Plays after first completes
             # Function returns immediately, speech plays in background
         """
-        if not text.strip():
+        if self._muted:
+            return
+
+        # WHY isspace() over strip(): same check without allocating a copy
+        if not text or text.isspace():
             self.logger.warning("Empty text provided, ignoring")
             return
 
-        # Add to queue - worker thread will process it
-        self._message_queue.put(text)
+        self.enqueue(text)
 
-        self.logger.debug(
-            f"Queued message: '{text[:30]}...' "
-            f"(queue size: {self.get_queue_size()})",
-        )
+    def enqueue(self, text: str, coalesce: bool = True) -> None:
+        """
+        Queue text that is already known to be non-empty.
+
+        Fast path for pre-validated text (e.g. messages from MessageLibrary,
+        which rejects empty text when it is added). Skips play()'s check.
+
+        Args:
+            text: Non-empty text to speak
+            coalesce: Drop text identical to the last one queued. Pass False
+                     for a deliberate repeat (e.g. the next sentence of the
+                     same text), which must still be spoken
+        """
+        if self._muted:
+            return
+
+        with self._idle_lock:
+            # Coalesce repeats (e.g. an error announced again by every press
+            # while the first announcement is still queued or playing):
+            # saying it twice in a row adds nothing and delays what's next
+            if coalesce and text == self._last_enqueued:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Dropped repeat: '{text[:30]}...'")
+                return
+
+            # Mark busy BEFORE queueing so a waiter can't see idle in between
+            self._pending += 1
+            self._idle_event.clear()
+
+            # Add to queue - worker thread will process it
+            # Put under the lock so _last_enqueued always matches the queue
+            self._message_queue.put(text)
+            self._last_enqueued = text
+
+        # WHY the level check: skip slicing/formatting when DEBUG is off
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Queued message: '{text[:30]}...' "
+                f"(queue size: {self.get_queue_size()})",
+            )
+
+    def prewarm(self, texts: Iterable[str]) -> None:
+        """
+        Pre-render texts with the TTS engine in the background.
+
+        Runs on the worker thread (TTS engines aren't thread-safe) and only
+        while nothing is queued for playback, so it never delays speech by
+        more than one render.
+
+        Args:
+            texts: Texts that are likely to be spoken later
+
+        Example:
+            audio_queue.prewarm(["System ready", "Recording started"])
+        """
+        self._prewarm.extend(texts)
+
+        # Wake an idle worker blocked in get()
+        self._message_queue.put(None)
 
     def clear_queue(self) -> int:
         """
@@ -218,22 +334,70 @@ class AudioQueue:
             cleared = audio_queue.clear_queue()
             print(f"Cleared {cleared} messages")
         """
+        # SimpleQueue has no bulk clear; each get_nowait() is a single C-level
+        # lock round-trip with no task bookkeeping
+        get_nowait = self._message_queue.get_nowait
         cleared_count = 0
+        drained_sentinel = False
 
         try:
             while True:
-                self._message_queue.get_nowait()
-                self._message_queue.task_done()
-                cleared_count += 1
+                if get_nowait() is None:
+                    drained_sentinel = True
+                else:
+                    cleared_count += 1
         except queue.Empty:
             # Queue is now empty
             pass
 
+        if drained_sentinel:
+            # Put the wake-up back, or the worker could miss stop()/prewarm()
+            self._message_queue.put(None)
+
+        # Unconditional: a re-put sentinel keeps the queue non-empty, and a
+        # stale value would silently drop the next identical message
+        with self._idle_lock:
+            self._last_enqueued = None
+
         if cleared_count > 0:
+            self._mark_done(cleared_count)
             self.logger.info(f"Cleared {cleared_count} queued messages")
 
         return cleared_count
 
+    def mute(self) -> None:
+        """
+        Mute playback: drop new messages and clear pending ones.
+
+        The currently speaking message (if any) still finishes.
+
+        Example:
+            audio_queue.mute()
+            audio_queue.play("Not spoken")  # Ignored while muted
+        """
+        self._muted = True
+        self.clear_queue()
+        self.logger.info("Audio muted")
+
+    def unmute(self) -> None:
+        """
+        Resume accepting messages after mute().
+
+        Example:
+            audio_queue.unmute()
+        """
+        self._muted = False
+        self.logger.info("Audio unmuted")
+
+    def is_muted(self) -> bool:
+        """
+        Check if playback is muted.
+
+        Returns:
+            True if play() is currently dropping messages
+        """
+        return self._muted
+
     def get_queue_size(self) -> int:
         """
         Get number of messages waiting in queue.
@@ -247,7 +411,10 @@ class AudioQueue:
             if audio_queue.get_queue_size() > 5:
                 print("Queue is getting long!")
         """
-        return self._message_queue.qsize()
+        # Derived from the pending counter rather than qsize(): the queue can
+        # also hold wake-up sentinels, which aren't messages
+        # (_pending counts queued + playing; one int read, no lock)
+        return max(0, self._pending - (1 if self._is_playing else 0))
 
     def is_playing(self) -> bool:
         """
@@ -257,8 +424,11 @@ class AudioQueue:
             True if speaking now, False if idle
 
         Example:
-            while audio_queue.is_playing():
-                time.sleep(0.1)  # Wait for speech to finish
+            if audio_queue.is_playing():
+                print("Speaking...")
+
+            # To block until speech finishes, prefer wait_until_idle() -
+            # it wakes on completion instead of polling this flag
         """
         return self._is_playing
 
@@ -273,7 +443,9 @@ class AudioQueue:
             if not audio_queue.is_busy():
                 print("Audio system is idle")
         """
-        return self._is_playing or not self._message_queue.empty()
+        # Pending counter, not queue emptiness: wake-up sentinels sit in the
+        # queue but aren't audio activity
+        return self._pending > 0
 
     def get_current_message(self) -> Optional[str]:
         """
@@ -308,27 +480,21 @@ class AudioQueue:
             audio_queue.wait_until_idle()  # Blocks until both are spoken
             print("All done!")
         """
-        try:
-            # Wait for queue to empty
-            if timeout:
-                self._message_queue.join()
-                # Additional check for is_playing
-                import time
-
-                start = time.time()
-                while self._is_playing and (time.time() - start) < timeout:
-                    time.sleep(0.1)
-                return not self._is_playing
-            self._message_queue.join()
-            # Wait for current message to finish
-            import time
-
-            while self._is_playing:
-                time.sleep(0.1)
-            return True
-        except Exception as e:
-            self.logger.error(f"Error waiting for idle: {e}")
-            return False
+        return self._idle_event.wait(timeout)
+
+    def _mark_done(self, count: int) -> None:
+        """
+        Record that messages finished (played or cleared).
+
+        Sets the idle event once nothing is queued or playing.
+
+        Args:
+            count: Number of messages that finished
+        """
+        with self._idle_lock:
+            self._pending = max(0, self._pending - count)
+            if self._pending == 0:
+                self._idle_event.set()
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -342,37 +508,58 @@ class AudioQueue:
             print(f"Queue size: {status['queue_size']}")
             print(f"Is playing: {status['is_playing']}")
         """
+        # WHY read each field once: separate is_busy()/get_queue_size() calls
+        # could disagree if a message finished between the two reads
+        is_playing = self._is_playing
+        pending = self._pending
+
         return {
-            "is_playing": self._is_playing,
+            "is_playing": is_playing,
             "current_message": self._current_message,
-            "queue_size": self.get_queue_size(),
-            "is_busy": self.is_busy(),
+            "queue_size": max(0, pending - (1 if is_playing else 0)),
+            "is_busy": pending > 0,
             "worker_running": self._worker_running,
+            "muted": self._muted,
         }
 
-    def stop(self) -> None:
+    def stop(self, timeout: float = THREAD_SHUTDOWN_TIMEOUT) -> bool:
         """
         Stop the worker thread and clear queue.
 
-        Call this when shutting down the audio system.
+        Call this when shutting down the audio system. Never blocks longer
+        than `timeout`: a worker stuck inside a wedged TTS driver is left
+        behind (it is a daemon thread) rather than hanging shutdown.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker to finish
+
+        Returns:
+            True if the worker stopped, False if it was still busy
 
         Example:
             audio_queue.stop()
         """
         self.logger.info("Stopping audio queue")
 
-        # Clear pending messages
+        # Clear pending messages (and pre-renders nobody will wait for)
+        self._prewarm.clear()
         self.clear_queue()
 
         # Stop worker thread
+        # The sentinel wakes the worker blocked in get() (it has no timeout)
         self._worker_running = False
+        self._message_queue.put(None)
 
         # Wait for worker to finish current message
         if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=3.0)
+            self._worker_thread.join(timeout=timeout)
+            if self._worker_thread.is_alive():
+                # _worker_running is already False: the worker exits on its
+                # own once the TTS call returns
+                self.logger.warning(
+                    f"Audio worker still busy after {timeout}s, not waiting",
+                )
+                return False
 
         self.logger.info("Audio queue stopped")
-
-    def __del__(self):
-        """Destructor - ensure worker is stopped"""
-        self.stop()
+        return True
@@ -10,10 +10,12 @@ SOLID Principles:
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from hardware.constants import AUDIO_MESSAGE_TEXTS, AudioMessage
 
+logger = logging.getLogger(__name__)
+
 
 class MessageLibrary:
     """
@@ -37,14 +39,24 @@ class MessageLibrary:
 
         Messages come from constants.py - centralized configuration!
         """
-        self.logger = logging.getLogger(__name__)
-
-        # Copy default messages from constants
-        # We copy so modifications don't affect the constant
-        self._messages = AUDIO_MESSAGE_TEXTS.copy()
-
-        self.logger.info(
-            f"Message Library initialized with {len(self._messages)} messages",
+        # Defaults are shared by reference with constants - never copied
+        # Customizations go into a per-instance override map layered on top
+        # WHY: no per-instance copy of every default string, the constant is
+        #   never mutated, and reset_to_defaults() is just clearing overrides
+        self._defaults = AUDIO_MESSAGE_TEXTS
+        self._overrides: Dict[AudioMessage, str] = {}
+
+        # Number of override keys that are NOT defaults, kept up to date by
+        # the mutators so get_message_count() never has to scan
+        self._custom_count = 0
+
+        # Key listing built on first use and dropped whenever keys change
+        # WHY: get_available_messages() and KeyError messages reuse it
+        #   instead of rebuilding the key list on every call
+        self._keys_cache: Optional[Tuple[AudioMessage, ...]] = None
+
+        logger.info(
+            f"Message Library initialized with {len(self)} messages",
         )
 
     def get_message(self, message_key: AudioMessage) -> str:
@@ -64,13 +76,17 @@ class MessageLibrary:
             text = lib.get_message(AudioMessage.RECORDING_START)
             # Returns: "Recording started"
         """
-        if message_key not in self._messages:
-            raise KeyError(
-                f"Unknown message key: {message_key}. "
-                f"Available keys: {self.get_available_messages()}",
-            )
-
-        return self._messages[message_key]
+        # WHY check the override map for emptiness first: Enum.__hash__ is
+        #   a Python-level method, so every dict probe costs a function call.
+        #   With no customizations (the normal case) there is no probe at all:
+        #   the default text is an attribute of the enum member
+        text = self._overrides.get(message_key) if self._overrides else None
+        if text is None:
+            if not isinstance(message_key, AudioMessage):
+                raise self._unknown_key_error(message_key)
+            text = message_key.text
+
+        return text
 
     def get_message_safe(
         self,
@@ -92,7 +108,10 @@ class MessageLibrary:
         Example:
             text = lib.get_message_safe(AudioMessage.RECORDING_START, "Default")
         """
-        return self._messages.get(message_key, default)
+        text = self._overrides.get(message_key) if self._overrides else None
+        if text is None:
+            text = self._defaults.get(message_key, default)
+        return text
 
     def add_custom_message(self, key: AudioMessage, text: str) -> None:
         """
@@ -112,14 +131,53 @@ class MessageLibrary:
             # Override existing message
             lib.add_custom_message(AudioMessage.SYSTEM_READY, "Système prêt")
         """
-        if not text.strip():
+        if not text or text.isspace():
             raise ValueError("Message text cannot be empty")
 
-        is_new = key not in self._messages
-        self._messages[key] = text
+        is_new = key not in self
+        self._overrides[key] = text
+        if is_new:
+            # New keys can only be non-default (defaults are always present)
+            self._custom_count += 1
+            self._keys_cache = None
 
         action = "Added" if is_new else "Updated"
-        self.logger.info(f"{action} message '{key.value}': {text}")
+        logger.info(f"{action} message '{key.value}': {text}")
+
+    def bulk_update(self, messages: Mapping[AudioMessage, str]) -> None:
+        """
+        Add or update several custom messages at once.
+
+        Equivalent to calling add_custom_message() for each entry, but the
+        key cache is invalidated once and a single summary is logged.
+        All-or-nothing: nothing changes if any text is empty.
+
+        Args:
+            messages: Message identifier -> text to speak
+
+        Raises:
+            ValueError: If any message text is empty
+
+        Example:
+            lib.bulk_update({
+                AudioMessage.SYSTEM_READY: "Système prêt",
+                AudioMessage.RECORDING_START: "Enregistrement démarré",
+            })
+        """
+        # Validate everything first so a bad entry leaves the library as-is
+        for key, text in messages.items():
+            if not text or text.isspace():
+                raise ValueError(f"Message text for '{key.value}' cannot be empty")
+
+        new_count = sum(1 for key in messages if key not in self)
+        self._overrides.update(messages)
+        if new_count:
+            self._custom_count += new_count
+            self._keys_cache = None
+
+        logger.info(
+            f"Updated {len(messages)} messages ({new_count} new)",
+        )
 
     def remove_custom_message(self, key: AudioMessage) -> None:
         """
@@ -134,18 +192,20 @@ class MessageLibrary:
             KeyError: If message doesn't exist
             ValueError: If trying to remove default message
         """
-        if key not in self._messages:
+        if key not in self:
             raise KeyError(f"Message key '{key.value}' not found")
 
         # Check if this is a default message
-        if key in AUDIO_MESSAGE_TEXTS:
+        if key in self._defaults:
             raise ValueError(
                 f"Cannot remove default message '{key.value}'. "
                 f"Use add_custom_message() to override it instead.",
             )
 
-        del self._messages[key]
-        self.logger.info(f"Removed custom message '{key.value}'")
+        del self._overrides[key]
+        self._custom_count -= 1
+        self._keys_cache = None
+        logger.info(f"Removed custom message '{key.value}'")
 
     def get_available_messages(self) -> List[AudioMessage]:
         """
@@ -159,7 +219,26 @@ class MessageLibrary:
             for key in keys:
                 print(f"{key.value}: {lib.get_message(key)}")
         """
-        return list(self._messages.keys())
+        return list(self._get_keys())
+
+    def _get_keys(self) -> Tuple[AudioMessage, ...]:
+        """Return the cached key tuple, rebuilding it after a mutation."""
+        if self._keys_cache is None:
+            extra = (key for key in self._overrides if key not in self._defaults)
+            self._keys_cache = (*self._defaults, *extra)
+        return self._keys_cache
+
+    def _unknown_key_error(self, message_key: AudioMessage) -> KeyError:
+        """
+        Build the KeyError for a missing message.
+
+        Kept out of get_message() so the key listing is only formatted
+        when a lookup actually misses.
+        """
+        return KeyError(
+            f"Unknown message key: {message_key}. "
+            f"Available keys: {list(self._get_keys())}",
+        )
 
     def get_message_count(self) -> Dict[str, int]:
         """
@@ -172,13 +251,13 @@ class MessageLibrary:
             counts = lib.get_message_count()
             print(f"Default: {counts['default']}, Custom: {counts['custom']}")
         """
-        default_count = sum(1 for key in self._messages if key in AUDIO_MESSAGE_TEXTS)
-        custom_count = len(self._messages) - default_count
+        # Overrides of default keys still count as default messages
+        default_count = len(self._defaults)
 
         return {
             "default": default_count,
-            "custom": custom_count,
-            "total": len(self._messages),
+            "custom": self._custom_count,
+            "total": default_count + self._custom_count,
         }
 
     def reset_to_defaults(self) -> None:
@@ -191,8 +270,10 @@ class MessageLibrary:
             # After adding custom messages
             lib.reset_to_defaults()  # Back to original messages
         """
-        self._messages = AUDIO_MESSAGE_TEXTS.copy()
-        self.logger.info("Message library reset to defaults")
+        self._overrides.clear()
+        self._custom_count = 0
+        self._keys_cache = None
+        logger.info("Message library reset to defaults")
 
     def __contains__(self, key: AudioMessage) -> bool:
         """
@@ -206,7 +287,7 @@ class MessageLibrary:
         Returns:
             True if message exists
         """
-        return key in self._messages
+        return key in self._overrides or key in self._defaults
 
     def __len__(self) -> int:
         """
@@ -217,7 +298,7 @@ class MessageLibrary:
         Returns:
             Number of messages in library
         """
-        return len(self._messages)
+        return len(self._defaults) + self._custom_count
 
     def __str__(self) -> str:
         """String representation of library for debugging"""
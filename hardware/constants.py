@@ -13,6 +13,8 @@ Why separate constants?
 """
 
 from enum import Enum
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Union
 
 from config.settings import (
     BUTTON_LONG_PRESS_DURATION,
@@ -35,9 +37,16 @@ from config.settings import (
 # Button debouncing prevents false triggers from electrical noise
 # when the button is pressed/released
 
-# How long to ignore button signals after a press (in seconds)
-# 50ms is standard for mechanical buttons - electrical bounce settles by then
-BUTTON_DEBOUNCE_TIME = 0.05
+# How long the GPIO library ignores edges after one it reported (seconds)
+# Only a first filter against bounce storms - the settle time below decides
+# the actual button state, so this can stay short
+BUTTON_DEBOUNCE_TIME = 0.01
+
+# How long the button must stay quiet (no edges) before its level counts as
+# a real press or release (seconds)
+# Contact bounce lasts a few ms; waiting for quiet instead of trusting the
+# first edge rejects it without a long dead time after every edge
+BUTTON_SETTLE_TIME = 0.01
 
 # Long press duration (imported from config.settings)
 # Hold button for this duration to trigger long press action
@@ -95,61 +104,85 @@ class AudioMessage(Enum):
     - Type safety: AudioMessage.SYSTEM_READY vs "system_ready" (typo-proof)
     - Autocomplete: IDE suggests all available messages
     - Refactoring: Change the value without breaking code
+
+    Each member carries its spoken text: member.value is the stable message
+    id ("system_ready"), member.text is what gets said ("System ready").
+    WHY keep the text on the member: reading it is a plain attribute load
+    (no dict hash + lookup per announcement), and a message can't exist
+    without its text.
     """
 
+    text: str
+
+    def __new__(cls, key: str, text: str):
+        obj = object.__new__(cls)
+        obj._value_ = key
+        obj.text = text
+        return obj
+
     # System status messages
-    SYSTEM_READY = "system_ready"
-    SYSTEM_ERROR = "system_error"
-    SYSTEM_SHUTDOWN = "system_shutdown"
+    SYSTEM_READY = ("system_ready", "System ready")
+    SYSTEM_ERROR = ("system_error", "System error")
+    SYSTEM_SHUTDOWN = ("system_shutdown", "System shutting down")
 
     # Recording lifecycle messages
-    RECORDING_START = "recording_start"
-    RECORDING_STOP = "recording_stop"
-    RECORDING_EXTENDED = "recording_extended"
+    RECORDING_START = ("recording_start", "Recording started")
+    RECORDING_STOP = ("recording_stop", "Recording complete, uploading")
+    RECORDING_EXTENDED = (
+        "recording_extended",
+        "5 minutes added, recording continues",
+    )
 
     # Warning messages
-    ONE_MINUTE_WARNING = "one_minute_warning"
-    EXTENSION_AVAILABLE = "extension_available"
+    ONE_MINUTE_WARNING = (
+        "one_minute_warning",
+        "One minute remaining, press button twice to extend",
+    )
+    EXTENSION_AVAILABLE = (
+        "extension_available",
+        "Press button twice to extend recording",
+    )
 
     # Status messages
-    READY_FOR_NEXT = "ready_for_next"
-    UPLOAD_COMPLETE = "upload_complete"
-    UPLOAD_FAILED = "upload_failed"
+    READY_FOR_NEXT = ("ready_for_next", "Ready for next recording")
+    UPLOAD_COMPLETE = ("upload_complete", "Upload successful")
+    UPLOAD_FAILED = ("upload_failed", "Upload failed, will retry")
 
     # Error messages
-    MEMORY_FULL = "memory_full"
-    NETWORK_DISCONNECTED = "network_disconnected"
-    CAMERA_ERROR = "camera_error"
-    STORAGE_ERROR = "storage_error"
-    UPLOAD_ERROR = "upload_error"
+    MEMORY_FULL = ("memory_full", "Memory full")
+    NETWORK_DISCONNECTED = ("network_disconnected", "Network disconnected")
+    CAMERA_ERROR = ("camera_error", "Camera error")
+    STORAGE_ERROR = ("storage_error", "Storage error")
+    UPLOAD_ERROR = ("upload_error", "Upload error")
 
     # Recovery messages
-    ERROR_RECOVERED = "error_recovered"
-    NETWORK_RESTORED = "network_restored"
-
-
-# The actual text for each message
-# This is separate from the Enum so you can easily translate or customize
-AUDIO_MESSAGE_TEXTS = {
-    AudioMessage.SYSTEM_READY: "System ready",
-    AudioMessage.SYSTEM_ERROR: "System error",
-    AudioMessage.SYSTEM_SHUTDOWN: "System shutting down",
-    AudioMessage.RECORDING_START: "Recording started",
-    AudioMessage.RECORDING_STOP: "Recording complete, uploading",
-    AudioMessage.RECORDING_EXTENDED: "5 minutes added, recording continues",
-    AudioMessage.ONE_MINUTE_WARNING: "One minute remaining, press button twice to extend",
-    AudioMessage.EXTENSION_AVAILABLE: "Press button twice to extend recording",
-    AudioMessage.READY_FOR_NEXT: "Ready for next recording",
-    AudioMessage.UPLOAD_COMPLETE: "Upload successful",
-    AudioMessage.UPLOAD_FAILED: "Upload failed, will retry",
-    AudioMessage.MEMORY_FULL: "Memory full",
-    AudioMessage.NETWORK_DISCONNECTED: "Network disconnected",
-    AudioMessage.CAMERA_ERROR: "Camera error",
-    AudioMessage.STORAGE_ERROR: "Storage error",
-    AudioMessage.UPLOAD_ERROR: "Upload error",
-    AudioMessage.ERROR_RECOVERED: "Error resolved, system ready",
-    AudioMessage.NETWORK_RESTORED: "Network connection restored",
-}
+    ERROR_RECOVERED = ("error_recovered", "Error resolved, system ready")
+    NETWORK_RESTORED = ("network_restored", "Network connection restored")
+
+
+# Message key -> text mapping, derived from the enum
+# Kept for code that wants the whole table (e.g. MessageLibrary defaults);
+# to change a message's text, edit the member above
+# WHY read-only: MessageLibrary shares this mapping instead of copying it,
+#   so an accidental write would change every library's defaults
+AUDIO_MESSAGE_TEXTS = MappingProxyType(
+    {message: message.text for message in AudioMessage},
+)
+
+# Minimum seconds between two plays of the same message (messages not
+# listed are never rate limited)
+# WHY: an error path stuck in a retry loop would otherwise announce the
+#   same error back to back and bury every other message behind it
+AUDIO_MESSAGE_MIN_INTERVAL = MappingProxyType(
+    {
+        AudioMessage.SYSTEM_ERROR: 5.0,
+        AudioMessage.CAMERA_ERROR: 5.0,
+        AudioMessage.STORAGE_ERROR: 5.0,
+        AudioMessage.UPLOAD_ERROR: 5.0,
+        AudioMessage.MEMORY_FULL: 5.0,
+        AudioMessage.NETWORK_DISCONNECTED: 5.0,
+    },
+)
 
 
 # =============================================================================
@@ -169,7 +202,7 @@ class LEDColor(Enum):
 class LEDPattern(Enum):
     """
     System states mapped to LED patterns.
-    Each pattern defines: (green, orange, red, should_blink, blink_color)
+    Each pattern's LEDState is defined in LED_PATTERN_CONFIG below.
     """
 
     # All off during boot
@@ -191,17 +224,33 @@ class LEDPattern(Enum):
     WARNING = "warning"
 
 
+class LEDState(NamedTuple):
+    """
+    LED states for one pattern.
+
+    WHY a NamedTuple: consumers read config.should_blink instead of
+    unpacking an anonymous 5-tuple by position, and it stays immutable.
+    """
+
+    green_on: bool
+    orange_on: bool
+    red_on: bool
+    should_blink: bool
+    blink_color: Optional[Union[LEDColor, str]]
+
+
 # Map each pattern to its LED states
-# Format: (green_on, orange_on, red_on, should_blink, blink_color)
 # Special: WARNING pattern uses "sequence" as blink_color to trigger animation
-LED_PATTERN_CONFIG = {
-    LEDPattern.OFF: (False, False, False, False, None),
-    LEDPattern.READY: (True, False, False, False, None),
-    LEDPattern.RECORDING: (False, False, False, True, LEDColor.GREEN),
-    LEDPattern.PROCESSING: (False, True, False, False, None),
-    LEDPattern.ERROR: (False, False, True, False, None),
-    LEDPattern.WARNING: (False, False, False, True, "sequence"),  # Special animation
-}
+LED_PATTERN_CONFIG = MappingProxyType(
+    {
+        LEDPattern.OFF: LEDState(False, False, False, False, None),
+        LEDPattern.READY: LEDState(True, False, False, False, None),
+        LEDPattern.RECORDING: LEDState(False, False, False, True, LEDColor.GREEN),
+        LEDPattern.PROCESSING: LEDState(False, True, False, False, None),
+        LEDPattern.ERROR: LEDState(False, False, True, False, None),
+        LEDPattern.WARNING: LEDState(False, False, False, True, "sequence"),
+    },
+)
 
 
 # =============================================================================
@@ -20,14 +20,80 @@ This demonstrates SOLID principles:
 """
 
 import logging
+import re
+import threading
+import time
+import weakref
 from typing import Any, Dict, List, Optional
 
 from hardware.audio.audio_queue import AudioQueue
 from hardware.audio.message_library import MessageLibrary
-from hardware.constants import TTS_SPEECH_RATE, TTS_VOLUME, AudioMessage
+from hardware.constants import (
+    AUDIO_MESSAGE_MIN_INTERVAL,
+    THREAD_SHUTDOWN_TIMEOUT,
+    TTS_SPEECH_RATE,
+    TTS_VOLUME,
+    AudioMessage,
+)
 from hardware.factory import create_tts
 from hardware.interfaces.tts_interface import TTSInterface
 
+# Module-level logger shared by every instance
+# WHY: no per-instance attribute, and log calls skip the self lookup
+logger = logging.getLogger(__name__)
+
+# Whitespace following sentence-ending punctuation (the split points)
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _shutdown(audio_queue: AudioQueue, tts_engine: TTSInterface) -> None:
+    """
+    Stop the queue worker and release the TTS engine.
+
+    Runs at most once per controller: from cleanup(), when the controller
+    is garbage collected, or at interpreter exit (weakref.finalize).
+    Takes the components rather than the controller so the finalizer
+    holds no reference that would keep the controller alive.
+    """
+    # Both steps share one THREAD_SHUTDOWN_TIMEOUT budget so a wedged eSpeak
+    # can't hang shutdown (or double the wait)
+    deadline = time.monotonic() + THREAD_SHUTDOWN_TIMEOUT
+    try:
+        audio_queue.stop(timeout=THREAD_SHUTDOWN_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Error stopping audio queue: {e}")
+
+    # Driver teardown has no timeout of its own: run it on a daemon thread
+    # and stop waiting when the budget runs out
+    teardown = threading.Thread(
+        target=_cleanup_engine,
+        args=(tts_engine,),
+        name="TTS-Cleanup",
+        daemon=True,
+    )
+    try:
+        teardown.start()
+    except RuntimeError:
+        # At interpreter exit (finalizer via atexit) new threads are refused
+        # (Python 3.12+): release the engine inline instead of leaking it
+        _cleanup_engine(tts_engine)
+        return
+
+    teardown.join(timeout=max(0.0, deadline - time.monotonic()))
+    if teardown.is_alive():
+        logger.warning(
+            f"TTS cleanup still running after {THREAD_SHUTDOWN_TIMEOUT}s, "
+            f"continuing shutdown",
+        )
+
+
+def _cleanup_engine(tts_engine: TTSInterface) -> None:
+    """Release the TTS engine, logging instead of raising."""
+    try:
+        tts_engine.cleanup()
+    except Exception as e:
+        logger.warning(f"Error during TTS cleanup: {e}")
+
 
 class AudioController:
     """
@@ -40,10 +106,14 @@ class AudioController:
     - Provides queue control
 
     Usage:
-        audio = AudioController()
-        audio.play_message(AudioMessage.RECORDING_START)
-        audio.play_text("Custom message")
-        audio.cleanup()
+        with AudioController() as audio:
+            audio.play_message(AudioMessage.RECORDING_START)
+            audio.play_text("Custom message")
+
+    Prefer the `with` statement or an explicit cleanup(). A controller that
+    is dropped or still alive at interpreter exit is shut down by a
+    weakref.finalize safety net (there is no __del__); when it was dropped,
+    that shutdown runs during garbage collection.
     """
 
     def __init__(self, tts_engine: Optional[TTSInterface] = None):
@@ -62,8 +132,6 @@ class AudioController:
             mock_tts = MockTTS(simulate_timing=False)
             audio = AudioController(tts_engine=mock_tts)
         """
-        self.logger = logging.getLogger(__name__)
-
         # Create or use provided TTS engine
         self.tts_engine = tts_engine or create_tts()
 
@@ -72,10 +140,36 @@ class AudioController:
         self.message_library = MessageLibrary()
         self.audio_queue = AudioQueue(self.tts_engine)
 
+        # WHY finalize instead of __del__: the callback runs at most once
+        #   (cleanup(), GC or interpreter exit - whichever comes first) and
+        #   holds only the components, so it can't resurrect the controller.
+        # It does NOT keep shutdown out of the garbage collector: a controller
+        #   dropped without cleanup()/__exit__ still runs _shutdown (thread
+        #   joins, TTS teardown) during collection. Call cleanup() to avoid it
+        self._finalizer = weakref.finalize(
+            self,
+            _shutdown,
+            self.audio_queue,
+            self.tts_engine,
+        )
+
+        # Last rate/volume successfully applied to the engine
+        # WHY: repeated set_volume()/set_speech_rate() calls with the same
+        #   value (e.g. a settings reload) become a compare, not an engine call
+        self._last_rate: Optional[int] = None
+        self._last_volume: Optional[float] = None
+
+        # When each rate-limited message was last played (monotonic seconds)
+        # See AUDIO_MESSAGE_MIN_INTERVAL in constants.py
+        self._last_played: Dict[AudioMessage, float] = {}
+
         # Configure TTS with defaults from constants
         self._configure_tts()
 
-        self.logger.info(
+        # After configuration: rendered audio depends on rate/volume/voice
+        self._prewarm_cache()
+
+        logger.info(
             f"Audio Controller initialized "
             f"(TTS available: {self.tts_engine.is_available()})",
         )
@@ -88,12 +182,28 @@ class AudioController:
         """
         try:
             self.tts_engine.set_rate(TTS_SPEECH_RATE)
+            self._last_rate = TTS_SPEECH_RATE
             self.tts_engine.set_volume(TTS_VOLUME)
-            self.logger.debug(
+            self._last_volume = TTS_VOLUME
+            logger.debug(
                 f"TTS configured: rate={TTS_SPEECH_RATE} WPM, volume={TTS_VOLUME}",
             )
         except Exception as e:
-            self.logger.warning(f"Could not configure TTS: {e}")
+            logger.warning(f"Could not configure TTS: {e}")
+
+    def _prewarm_cache(self) -> None:
+        """
+        Pre-render every predefined message in the background.
+
+        WHY: the first play_message() of each phrase otherwise pays the
+        full synthesis time (hundreds of ms on a Pi) right when the user is
+        waiting for feedback. The audio worker renders them while idle;
+        engines without a render cache treat this as a no-op.
+        """
+        library = self.message_library
+        self.audio_queue.prewarm(
+            library.get_message(key) for key in library.get_available_messages()
+        )
 
     # =========================================================================
     # PLAYBACK METHODS
@@ -110,22 +220,44 @@ class AudioController:
 
         Note:
             If the message key is not found, error is logged but no exception raised.
+            Messages listed in AUDIO_MESSAGE_MIN_INTERVAL are dropped when
+            played again before their interval has elapsed.
 
         Example:
             audio.play_message(AudioMessage.RECORDING_START)
             audio.play_message(AudioMessage.ONE_MINUTE_WARNING)
         """
+        # Muted: skip the library lookup and log entirely
+        if self.audio_queue.is_muted():
+            return
+
+        min_interval = AUDIO_MESSAGE_MIN_INTERVAL.get(message_key)
+        if min_interval is not None:
+            now = time.monotonic()
+            last = self._last_played.get(message_key)
+            if last is not None and now - last < min_interval:
+                # A burst of repeats is exactly when this path runs hot
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Rate limited message: {message_key.value}")
+                return
+            self._last_played[message_key] = now
+
         try:
             # Get message text from library
             text = self.message_library.get_message(message_key)
 
             # Queue for playback
-            self.audio_queue.play(text)
+            # WHY enqueue(): library text was validated when it was added,
+            #   so skip re-checking it on every dispatch
+            self.audio_queue.enqueue(text)
 
-            self.logger.info(f"Playing message: {message_key.value}")
+            # WHY the level check: when INFO is filtered out (e.g. a quieter
+            #   deployment), skip building this f-string on every dispatch
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Playing message: {message_key.value}")
 
         except KeyError as e:
-            self.logger.error(f"Unknown message key: {message_key}: {e}")
+            logger.error(f"Unknown message key: {message_key}: {e}")
 
     def play_text(self, text: str) -> None:
         """
@@ -133,18 +265,42 @@ class AudioController:
 
         Returns immediately - speech plays in background.
 
+        Multi-sentence text is queued one sentence at a time, so the first
+        sentence starts playing after only its own synthesis instead of
+        waiting for the whole paragraph.
+
         Args:
             text: Text to speak
 
         Example:
             audio.play_text("Recording will start in 3 seconds")
         """
-        if not text.strip():
-            self.logger.warning("Empty text provided for speech")
+        if self.audio_queue.is_muted():
             return
 
-        self.logger.info(f"Playing text: '{text[:50]}...'")
-        self.audio_queue.play(text)
+        if not text or text.isspace():
+            logger.warning("Empty text provided for speech")
+            return
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Playing text: '{text[:50]}...'")
+        # Only the first sentence is coalesced with what is already queued:
+        #   a repeat inside one text ("Warning. Warning.") is meant to be heard
+        for index, sentence in enumerate(self._split_sentences(text)):
+            self.audio_queue.enqueue(sentence, coalesce=index == 0)
+
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        """
+        Split text into sentences for incremental playback.
+
+        Args:
+            text: Non-empty text
+
+        Returns:
+            Non-empty sentences in order (the whole text if it has no breaks)
+        """
+        return [sentence for sentence in _SENTENCE_BREAK.split(text) if sentence]
 
     # =========================================================================
     # QUEUE CONTROL
@@ -163,7 +319,7 @@ class AudioController:
         """
         cleared = self.audio_queue.clear_queue()
         if cleared > 0:
-            self.logger.info(f"Cleared {cleared} pending messages")
+            logger.info(f"Cleared {cleared} pending messages")
 
     def clear_queue(self) -> int:
         """
@@ -174,6 +330,30 @@ class AudioController:
         """
         return self.audio_queue.clear_queue()
 
+    def mute(self) -> None:
+        """
+        Mute audio: ignore new messages and clear pending ones.
+
+        Example:
+            audio.mute()  # e.g. quiet hours
+            audio.play_message(AudioMessage.SYSTEM_READY)  # Not spoken
+            audio.unmute()
+        """
+        self.audio_queue.mute()
+
+    def unmute(self) -> None:
+        """Resume audio playback after mute()."""
+        self.audio_queue.unmute()
+
+    def is_muted(self) -> bool:
+        """
+        Check if audio is muted.
+
+        Returns:
+            True if messages are currently being ignored
+        """
+        return self.audio_queue.is_muted()
+
     def is_playing(self) -> bool:
         """
         Check if audio is currently playing.
@@ -226,11 +406,15 @@ class AudioController:
         Example:
             audio.set_volume(0.5)  # Half volume
         """
+        if volume == self._last_volume:
+            return
+
         try:
             self.tts_engine.set_volume(volume)
-            self.logger.info(f"Volume set to {volume}")
+            self._last_volume = volume
+            logger.info(f"Volume set to {volume}")
         except Exception as e:
-            self.logger.error(f"Failed to set volume: {e}")
+            logger.error(f"Failed to set volume: {e}")
 
     def set_speech_rate(self, rate: int) -> None:
         """
@@ -245,11 +429,15 @@ class AudioController:
         Example:
             audio.set_speech_rate(150)  # Normal pace
         """
+        if rate == self._last_rate:
+            return
+
         try:
             self.tts_engine.set_rate(rate)
-            self.logger.info(f"Speech rate set to {rate} WPM")
+            self._last_rate = rate
+            logger.info(f"Speech rate set to {rate} WPM")
         except Exception as e:
-            self.logger.error(f"Failed to set speech rate: {e}")
+            logger.error(f"Failed to set speech rate: {e}")
 
     # =========================================================================
     # MESSAGE LIBRARY METHODS
@@ -268,6 +456,21 @@ class AudioController:
         """
         self.message_library.add_custom_message(key, text)
 
+    def add_custom_messages(self, messages: Dict[AudioMessage, str]) -> None:
+        """
+        Add or update several custom messages in one call.
+
+        Prefer this over looping add_custom_message() when loading a set of
+        messages (e.g. a translation) - the library is updated in one pass.
+
+        Args:
+            messages: Message identifier -> text to speak
+
+        Example:
+            audio.add_custom_messages({AudioMessage.SYSTEM_READY: "Prêt"})
+        """
+        self.message_library.bulk_update(messages)
+
     def get_available_messages(self) -> List[AudioMessage]:
         """
         Get list of available message keys.
@@ -292,7 +495,7 @@ class AudioController:
             audio = AudioController()
             audio.test_audio()  # Listen for test messages
         """
-        self.logger.info("Starting audio test")
+        logger.info("Starting audio test")
 
         test_messages = [
             "Audio system test",
@@ -302,13 +505,13 @@ class AudioController:
         ]
 
         for message in test_messages:
-            self.logger.info(f"Testing: {message}")
+            logger.info(f"Testing: {message}")
             self.play_text(message)
 
         # Wait for all messages to complete
         self.wait_until_idle()
 
-        self.logger.info("Audio test complete")
+        logger.info("Audio test complete")
 
     def test_all_messages(self) -> None:
         """
@@ -320,16 +523,16 @@ class AudioController:
         Example:
             audio.test_all_messages()  # Hear all system messages
         """
-        self.logger.info("Testing all predefined messages")
+        logger.info("Testing all predefined messages")
 
         for message_key in self.get_available_messages():
-            self.logger.info(f"Testing: {message_key.value}")
+            logger.info(f"Testing: {message_key.value}")
             self.play_message(message_key)
 
         # Wait for completion
         self.wait_until_idle()
 
-        self.logger.info("All message tests complete")
+        logger.info("All message tests complete")
 
     def check_audio_system(self) -> Dict[str, Any]:
         """
@@ -384,6 +587,7 @@ class AudioController:
         Clean up audio resources.
 
         IMPORTANT: Always call this before program exits!
+        Safe to call more than once; only the first call does anything.
 
         Example:
             audio = AudioController()
@@ -392,23 +596,38 @@ class AudioController:
             finally:
                 audio.cleanup()  # Always cleanup
         """
-        self.logger.info("Cleaning up Audio Controller")
+        # A finalizer that has already run (or been called) is dead
+        if not self._finalizer.alive:
+            return
 
-        # Stop queue worker
-        self.audio_queue.stop()
+        logger.info("Cleaning up Audio Controller")
 
-        # Clean up TTS engine
-        try:
-            self.tts_engine.cleanup()
-        except Exception as e:
-            self.logger.warning(f"Error during TTS cleanup: {e}")
+        # Calling the finalizer runs _shutdown now and detaches it
+        self._finalizer()
+
+        logger.info("Audio Controller cleanup complete")
+
+    def __enter__(self):
+        """
+        Enter context manager.
 
-        self.logger.info("Audio Controller cleanup complete")
+        Usage:
+            with AudioController() as audio:
+                audio.play_message(AudioMessage.SYSTEM_READY)
+        """
+        return self
 
-    def __del__(self):
+    def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Destructor - ensures cleanup even if not explicitly called.
+        Exit context manager - always cleanup.
+
+        Args:
+            exc_type: Exception type if exception occurred
+            exc_val: Exception value if exception occurred
+            exc_tb: Exception traceback if exception occurred
 
-        This is a safety net. You should still call cleanup() explicitly.
+        Returns:
+            False - propagates exceptions up the stack
         """
         self.cleanup()
+        return False
@@ -18,15 +18,21 @@ This demonstrates SOLID principles:
 - Dependency Inversion: Depends on GPIOInterface, not RPi.GPIO
 """
 
+import atexit
 import logging
 import threading
 import time
-from typing import Any, Callable, Dict, Optional
+import weakref
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from hardware.constants import (
     BUTTON_DEBOUNCE_TIME,
     BUTTON_LONG_PRESS_DURATION,
+    BUTTON_SETTLE_TIME,
     GPIO_BUTTON_PIN,
+    THREAD_SHUTDOWN_TIMEOUT,
 )
 from hardware.factory import create_gpio
 from hardware.interfaces.gpio_interface import (
@@ -37,6 +43,25 @@ from hardware.interfaces.gpio_interface import (
 )
 from hardware.utils.gpio_utils import safe_gpio_cleanup
 
+# Edges buffered between the interrupt and the worker; a chattering button
+# can't grow it without bound (oldest edges are dropped first)
+_MAX_PENDING_EDGES = 16
+
+
+# Controllers not yet cleaned up, for the single atexit hook below
+# WHY one WeakSet + one hook instead of an atexit.register() per instance:
+#   registrations can't be undone by cleanup(), so every controller created
+#   (tests, re-inits) would leave a dead entry behind for the whole process
+_live_controllers: "weakref.WeakSet[ButtonController]" = weakref.WeakSet()
+
+
+@atexit.register
+def _cleanup_at_exit() -> None:
+    """atexit safety net: clean up controllers that are still alive."""
+    # Copy first: cleanup() removes each controller from the set
+    for controller in list(_live_controllers):
+        controller.cleanup()
+
 
 class ButtonPress:
     """
@@ -54,12 +79,26 @@ class ButtonPress:
     LONG = "long"  # Hold >= long press duration (triggers while holding)
 
 
+class _PressState(Enum):
+    """
+    Where the current press is - owned by the button worker thread.
+
+    IDLE → PRESSED on press; PRESSED → LONG_HELD when the long press fires;
+    release from PRESSED gives SHORT, release from LONG_HELD gives nothing.
+    """
+
+    IDLE = "idle"  # Button up
+    PRESSED = "pressed"  # Down, long press threshold not reached yet
+    LONG_HELD = "long_held"  # Down, LONG already fired - release is ignored
+
+
 class ButtonController:
     """
     Manages button input with debouncing and long press detection.
 
     Features:
-    - Hardware debouncing (ignores electrical noise)
+    - Debouncing: GPIO library bouncetime, then a settle delay (the level
+      must stay unchanged for settle_time before it counts)
     - Short vs long press detection (on-threshold for LONG)
     - Interrupt-driven (efficient - no polling)
     - Works with real GPIO or mock for testing
@@ -76,8 +115,11 @@ class ButtonController:
             elif press_type == ButtonPress.LONG:
                 print("Long press - immediate feedback!")
 
-        button = ButtonController()
-        button.register_callback(on_button)
+        with ButtonController() as button:
+            button.register_callback(on_button)
+
+    Lifecycle: outside a `with` block, call cleanup() yourself. A
+    controller still alive at interpreter exit is cleaned up by atexit.
     """
 
     def __init__(
@@ -120,22 +162,56 @@ class ButtonController:
 
         # Timing configuration from constants (no magic numbers!)
         self.debounce_time = BUTTON_DEBOUNCE_TIME
+        self.settle_time = BUTTON_SETTLE_TIME
         self.long_press_duration = BUTTON_LONG_PRESS_DURATION
 
-        # State tracking
+        # Pin level that means "pressed"
+        # With pull-up: pressed = LOW, released = HIGH
+        # With pull-down: pressed = HIGH, released = LOW
+        self._pressed_state = PinState.LOW if pull_up else PinState.HIGH
+
+        # State tracking (time.monotonic() timestamps - immune to clock jumps)
+        # Owned by the worker thread; the interrupt handler never touches it
         self.button_press_time: Optional[float] = None  # When button pressed down
-        self.last_event_time = 0.0  # For debouncing
+        self.last_event_time = 0.0  # Last edge seen (diagnostics)
         self.callback_func: Optional[Callable[[str], None]] = None
-
-        # Long press timer (fires when threshold reached)
-        self._long_press_timer: Optional[threading.Timer] = None
-        self.long_press_triggered = False  # Prevents SHORT on release after LONG
+        # WHY one state instead of flags: each transition is decided by the
+        #   current state alone - no combination of flags to keep consistent
+        self._press_state = _PressState.IDLE
+
+        # Hand-off from interrupt to worker: (timestamp, is_pressed) edges
+        # WHY: the interrupt handler only records the edge and returns. One
+        #   long-lived worker applies the press/release/long-press logic, so
+        #   that state has a single owner and no per-press Timer thread is
+        #   needed. The worker also sleeps until the long press deadline
+        #   (None = not armed) and fires LONG while the button is held
+        self._cv = threading.Condition()
+        self._edges: Deque[Tuple[float, bool]] = deque(maxlen=_MAX_PENDING_EDGES)
+        self._long_press_deadline: Optional[float] = None
+
+        # Shutdown signal, set once by cleanup()
+        # WHY an Event: anything waiting with a timeout (see test_button)
+        #   wakes the moment it is set, instead of sleeping out the interval
+        self._stop_event = threading.Event()
 
         self._cleaned_up = False
 
         # Initialize hardware
         self._setup_button()
 
+        self._worker_thread = threading.Thread(
+            target=self._button_worker,
+            daemon=True,
+            name="Button-Worker",
+        )
+        self._worker_thread.start()
+
+        # Safety net for a forgotten cleanup()
+        # WHY atexit instead of __del__: the worker thread keeps this object
+        #   alive until cleanup(), so __del__ could never run. A WeakSet so
+        #   the registry doesn't keep the controller alive either
+        _live_controllers.add(self)
+
         self.logger.info(
             f"Button Controller initialized (pin: {self.pin}, pull_up: {pull_up})",
         )
@@ -157,158 +233,256 @@ class ButtonController:
             pull_mode = PullMode.UP if self.pull_up else PullMode.DOWN
             self.gpio.setup_input(self.pin, pull_mode)
 
-            # Setup interrupt callback for BOTH edges
-            # We need to detect both press (falling) and release (rising)
-            # to measure how long the button was held
-            edge = EdgeDetection.BOTH
-
-            # Convert debounce time to milliseconds
-            debounce_ms = int(self.debounce_time * 1000)
-
-            # Register interrupt callback
-            # This means _on_button_interrupt runs AUTOMATICALLY when button
-            # is pressed OR released - No polling loop needed - very efficient!
-            self.gpio.add_event_callback(
-                self.pin,
-                edge,
-                self._on_button_interrupt,
-                debounce_ms,
-            )
-
-            self.logger.debug(
-                f"Button setup complete (edge: BOTH, debounce: {debounce_ms}ms)",
-            )
+            self._register_interrupt()
         except Exception as e:
             self.logger.error(f"Failed to setup button on pin {self.pin}: {e}")
             raise
 
+    def _register_interrupt(self) -> None:
+        """
+        Register the edge interrupt with the current debounce time.
+
+        The GPIO library's bouncetime is the first debounce stage (the
+        worker's settle delay is the second), so this is re-run by
+        set_timing() when the debounce time changes.
+
+        Raises:
+            GPIOError: If callback registration fails
+        """
+        # Setup interrupt callback for BOTH edges
+        # We need to detect both press (falling) and release (rising)
+        # to measure how long the button was held
+        edge = EdgeDetection.BOTH
+
+        # Convert debounce time to milliseconds
+        debounce_ms = int(self.debounce_time * 1000)
+
+        # Register interrupt callback
+        # This means _on_button_interrupt runs AUTOMATICALLY when button
+        # is pressed OR released - No polling loop needed - very efficient!
+        self.gpio.add_event_callback(
+            self.pin,
+            edge,
+            self._on_button_interrupt,
+            debounce_ms,
+        )
+
+        self.logger.debug(
+            f"Button interrupt registered (edge: BOTH, debounce: {debounce_ms}ms)",
+        )
+
     def _on_button_interrupt(self, channel: int) -> None:
         """
         GPIO interrupt handler - called on button press OR release.
 
-        This runs in a separate thread created by the GPIO library.
-        We need to be thread-safe here!
+        This runs in a separate thread created by the GPIO library. It only
+        records the edge (timestamp + pressed/released) and wakes the
+        worker - all press logic runs in _button_worker.
 
         Args:
             channel: GPIO pin that triggered (always our button pin)
+        """
+        # WHY no debounce here?
+        # Context: Mechanical button switches bounce - contact opens/closes
+        #   several times within a few ms. Every edge is recorded as-is; the
+        #   worker only acts once the button has been quiet for settle_time
+        #   (see _button_worker), so the bounces collapse into one change.
+        #
+        # Tradeoff: presses and releases are reported settle_time after the
+        #   last bounce - 10ms, far below what a person can notice
+        now = time.monotonic()
+
+        # Read the level now - it's the state at the time of this edge
+        # `is`: read() returns PinState members (singletons), so identity is
+        #   the whole comparison - no __eq__ dispatch per edge
+        is_pressed = self.gpio.read(self.pin) is self._pressed_state
+
+        with self._cv:
+            self._edges.append((now, is_pressed))
+            self._cv.notify()
+
+    def _button_worker(self) -> None:
+        """
+        Button worker thread - turns edges into SHORT/LONG presses.
+
+        Sleeps on the condition until an edge arrives, the newest edge has
+        settled, or the armed long press deadline passes. Edges are drained
+        in one batch and handled in order, outside the lock, so callbacks
+        never block the interrupt handler. cleanup() wakes it to exit.
+
+        Debouncing ("defer until quiet"):
+        An edge only counts once no other edge followed it for settle_time.
+        The newest edge is then confirmed by reading the pin, so a final
+        edge dropped by the GPIO library's bouncetime can't leave the
+        button stuck in the wrong state. A burst that ends at the level it
+        started from (a glitch) is ignored.
 
         How this works:
-        1. Button pressed → Start timer to fire LONG at threshold
-        2. Timer reaches threshold → LONG callback (while still holding)
-        3. Button released before threshold → Cancel timer, trigger SHORT
+        1. Button pressed → Arm long press deadline
+        2. Deadline reached → LONG callback (while still holding)
+        3. Button released before threshold → Disarm deadline, trigger SHORT
         4. Button released after LONG → Do nothing (already handled)
         """
-        current_time = time.time()
+        # Newest edge that hasn't been quiet for settle_time yet
+        pending: Optional[Tuple[float, bool]] = None
 
-        # WHY dual debouncing (hardware + software)?
-        # Context: Mechanical button switches bounce - contact opens/closes
-        #   multiple times in ~20ms before settling
-        #   - Hardware debouncing (via GPIO library): Filters electrical noise,
-        #     but not perfectly reliable
-        #   - Software debouncing: Acts as safety net in case hardware missed
-        #     bounces
-        #   - "Belt and suspenders" approach ensures reliability even with
-        #     cheap/worn buttons
-        #
-        # Tradeoff: We lose some very fast presses (faster than debounce_time),
-        #   but that's acceptable for human-scale interactions (typical debounce
-        #   is 50ms, human fastest click is ~100ms)
-        #
-        # Risk: This check has a subtle race condition!
-        #   If button bounces VERY fast and this handler runs twice in parallel
-        #   somehow, we could get two button presses. But in practice RPi.GPIO
-        #   blocks at hardware level, and we're in a single-threaded GPIO
-        #   callback, so this is safe.
-        time_since_last = current_time - self.last_event_time
-        if time_since_last < self.debounce_time:
-            self.logger.debug("Button event ignored (software debounce)")
-            return
+        while True:
+            batch = self._wait_for_edges(pending)
+            if batch is None:
+                return
 
-        # Update timing for next event
-        self.last_event_time = current_time
+            for edge in batch:
+                # Quiet until this edge arrived (the worker fell behind while
+                # a callback ran): the previous edge's level was stable
+                if pending is not None and edge[0] - pending[0] >= self.settle_time:
+                    self._handle_edge(*pending)
+                pending = edge
+
+            if pending is not None:
+                if time.monotonic() - pending[0] < self.settle_time:
+                    continue  # Still bouncing - wait for quiet
+
+                # Quiet now: the pin's current level is the settled state
+                is_pressed = self.gpio.read(self.pin) is self._pressed_state
+                self._handle_edge(pending[0], is_pressed)
+                pending = None
+
+            deadline = self._long_press_deadline
+            if deadline is not None and time.monotonic() >= deadline:
+                # Threshold reached - disarm so it fires only once
+                self._long_press_deadline = None
+                self._trigger_long_press()
+
+    def _wait_for_edges(
+        self,
+        pending: Optional[Tuple[float, bool]],
+    ) -> Optional[List[Tuple[float, bool]]]:
+        """
+        Sleep until edges arrive or the next deadline passes (worker only).
 
-        # Read current pin state to determine if pressed or released
-        pin_state = self.gpio.read(self.pin)
+        Args:
+            pending: Newest unsettled edge, or None
 
-        # Determine if button is currently pressed based on pull resistor config
-        # With pull-up: pressed = LOW, released = HIGH
-        # With pull-down: pressed = HIGH, released = LOW
-        if self.pull_up:
-            is_pressed = pin_state == PinState.LOW
-        else:
-            is_pressed = pin_state == PinState.HIGH
+        Returns:
+            The drained edges (empty when a deadline passed), or None once
+            cleanup() has asked the worker to stop
+        """
+        cv = self._cv
+        edges = self._edges
+
+        with cv:
+            while True:
+                if self._stop_event.is_set():
+                    return None
+
+                if edges:
+                    batch = list(edges)
+                    edges.clear()
+                    return batch
+
+                # An unsettled edge holds back the long press: it may be
+                # the release that arrived just before the threshold
+                deadline: Optional[float]
+                if pending is not None:
+                    deadline = pending[0] + self.settle_time
+                else:
+                    deadline = self._long_press_deadline
+                if deadline is None:
+                    cv.wait()
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+
+                cv.wait(remaining)
+
+    def _handle_edge(self, timestamp: float, is_pressed: bool) -> None:
+        """
+        Apply one settled level to the press state (worker thread only).
+
+        A level matching the current state (the button bounced back to
+        where it was) is not a press or release and is ignored.
+
+        Args:
+            timestamp: time.monotonic() of the edge that started this level
+            is_pressed: Settled level - True for pressed
+        """
+        state = self._press_state
 
         if is_pressed:
-            # Button pressed down - start timer for long press detection
-            self.button_press_time = current_time
-            self.long_press_triggered = False
+            if state is not _PressState.IDLE:
+                return  # Still down
+
+            # Diagnostics only (reported by get_status())
+            self.last_event_time = timestamp
 
-            # Cancel any existing timer (from previous press)
-            if self._long_press_timer:
-                self._long_press_timer.cancel()
+            # Button pressed down - arm long press detection
+            self._press_state = _PressState.PRESSED
+            self.button_press_time = timestamp
 
-            # Start timer that fires when long press threshold reached
-            # WHY threading.Timer?
+            # WHY fire at the threshold instead of on release?
             # Context: We want immediate feedback when threshold is reached,
-            #   without waiting for button release. Timer runs in separate
-            #   thread and fires automatically after long_press_duration.
-            #   This gives instant user feedback (e.g., LED change, extend
-            #   recording) while they're still holding the button.
-            self._long_press_timer = threading.Timer(
-                self.long_press_duration,
-                self._trigger_long_press,
-            )
-            self._long_press_timer.start()
+            #   without waiting for button release. The worker wakes at the
+            #   deadline and fires LONG while the user is still holding
+            #   (e.g., LED change, extend recording).
+            self._long_press_deadline = timestamp + self.long_press_duration
 
-            self.logger.debug("Button pressed down, timer started")
-        else:
-            # Button released - handle based on whether LONG already triggered
-            if self.button_press_time is None:
-                # Spurious release event (no matching press)
-                self.logger.debug("Button release ignored (no press recorded)")
-                return
+            self.logger.debug("Button pressed down, long press armed")
+            return
+
+        press_time = self.button_press_time
+        if state is _PressState.IDLE or press_time is None:
+            return  # Still up (a press always records press_time)
 
-            hold_duration = current_time - self.button_press_time
-            self.button_press_time = None  # Clear for next press
+        self.last_event_time = timestamp
+        hold_duration = timestamp - press_time
 
-            # Cancel timer if still running
-            if self._long_press_timer:
-                self._long_press_timer.cancel()
-                self._long_press_timer = None
+        # Any release ends the press and disarms a long press not yet fired
+        self._press_state = _PressState.IDLE
+        self.button_press_time = None
+        self._long_press_deadline = None
 
-            # If LONG already triggered, do nothing (user feedback already given)
-            if self.long_press_triggered:
+        if state is _PressState.LONG_HELD:
+            # LONG already fired - user feedback already given
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     f"Button released after LONG (held {hold_duration:.2f}s) "
                     f"- ignored",
                 )
-                return
+            return
 
-            # Otherwise, trigger SHORT press
-            self.logger.debug(
-                f"Short press detected (held {hold_duration:.2f}s)",
-            )
-            self._trigger_callback(ButtonPress.SHORT)
+        # WHY the level checks: skip formatting the f-strings on every press
+        #   when DEBUG is off (the usual case)
+        if hold_duration >= self.long_press_duration:
+            # Press and release reached the worker together after the
+            # threshold (it was busy in a callback) - still a LONG press
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Late long press (held {hold_duration:.2f}s)")
+            self._trigger_callback(ButtonPress.LONG)
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Short press detected (held {hold_duration:.2f}s)")
+        self._trigger_callback(ButtonPress.SHORT)
 
     def _trigger_long_press(self) -> None:
         """
-        Timer callback - called when button held for long_press_duration.
+        Called by the worker when button held for long_press_duration.
 
-        This runs in Timer's thread (separate from GPIO interrupt thread).
-        Sets flag to prevent SHORT callback on subsequent release.
-
-        WHY this method exists:
-        Context: Timer.start() requires a callable with no arguments.
-        We need to set the flag and trigger the callback, so we wrap
-        this logic in a dedicated method that Timer can call.
+        Moves to LONG_HELD so the release that follows is ignored.
         """
-        if self.button_press_time and not self.long_press_triggered:
-            self.long_press_triggered = True
-            hold_duration = time.time() - self.button_press_time
+        press_time = self.button_press_time
+        if self._press_state is not _PressState.PRESSED or press_time is None:
+            return
+
+        self._press_state = _PressState.LONG_HELD
+        if self.logger.isEnabledFor(logging.DEBUG):
+            hold_duration = time.monotonic() - press_time
             self.logger.debug(
                 f"Long press threshold reached (held {hold_duration:.2f}s)",
             )
-            self._trigger_callback(ButtonPress.LONG)
+        self._trigger_callback(ButtonPress.LONG)
 
     def _trigger_callback(self, press_type: str) -> None:
         """
@@ -317,7 +491,7 @@ class ButtonController:
         Args:
             press_type: ButtonPress.SHORT or ButtonPress.LONG
 
-        This runs in a background thread (from GPIO interrupt),
+        This runs in the button worker thread (not the main thread),
         so the callback needs to be thread-safe!
         """
         if self.callback_func:
@@ -383,6 +557,12 @@ class ButtonController:
                     f"Expected 0.01-0.5 seconds",
                 )
             self.debounce_time = debounce_time
+
+            # Debounce lives in the GPIO library - re-register to apply it
+            if not self._cleaned_up:
+                self.gpio.remove_event_callback(self.pin)
+                self._register_interrupt()
+
             self.logger.info(f"Debounce time set to {debounce_time}s")
 
         if long_press_duration is not None:
@@ -418,9 +598,12 @@ class ButtonController:
         self.register_callback(test_callback)
 
         # Wait for duration
+        # WHY wait on the stop event instead of sleeping: cleanup() from
+        #   another thread ends the test at once instead of after duration
         self.logger.info("Press button to test (short and long presses)")
         try:
-            time.sleep(duration)
+            if self._stop_event.wait(duration):
+                self.logger.info("Test ended by cleanup()")
         except KeyboardInterrupt:
             self.logger.info("Test interrupted")
 
@@ -444,8 +627,9 @@ class ButtonController:
             "pull_up": self.pull_up,
             "gpio_available": self.gpio.is_available(),
             "debounce_time": self.debounce_time,
+            "settle_time": self.settle_time,
             "long_press_duration": self.long_press_duration,
-            "button_is_pressed": self.button_press_time is not None,
+            "button_is_pressed": self._press_state is not _PressState.IDLE,
             "callback_registered": self.callback_func is not None,
             "last_event_time": self.last_event_time,
         }
@@ -461,11 +645,13 @@ class ButtonController:
             return
 
         self.logger.info("Cleaning up Button Controller")
+        _live_controllers.discard(self)
 
-        # Cancel long press timer if active
-        if self._long_press_timer:
-            self._long_press_timer.cancel()
-            self._long_press_timer = None
+        # Stop worker thread
+        with self._cv:
+            self._stop_event.set()
+            self._cv.notify_all()
+        self._worker_thread.join(timeout=THREAD_SHUTDOWN_TIMEOUT)
 
         # Remove interrupt callback
         try:
@@ -503,17 +689,3 @@ class ButtonController:
         """
         self.cleanup()
         return False
-
-    def __del__(self):
-        """
-        Destructor - fallback cleanup if not properly closed.
-
-        WARNING: Use context manager (`with` statement) or
-        call cleanup() explicitly instead of relying on __del__.
-        """
-        if not self._cleaned_up:
-            self.logger.warning(
-                "ButtonController not properly cleaned up - "
-                "use 'with' statement or call cleanup() explicitly",
-            )
-            self.cleanup()
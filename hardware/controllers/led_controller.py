@@ -21,7 +21,7 @@ This demonstrates SOLID principles:
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from config.settings import (
     GPIO_LED_BLUE,
@@ -66,12 +66,62 @@ from hardware.constants import (
 from hardware.factory import create_gpio
 from hardware.interfaces.gpio_interface import GPIOInterface, PinState
 from hardware.utils import (
-    PatternParseError,
-    parse_pattern,
+    MASK_GREEN,
+    MASK_ORANGE,
+    MASK_RED,
+    compile_pattern,
     safe_gpio_cleanup,
     setup_led_pins,
 )
 
+# WHY compile patterns at import time?
+# Context: Pattern strings are fixed config - compiling them once here means
+#   the animation thread never splits/scans strings, it just indexes a tuple
+#   of bitmasks. Invalid patterns in config/settings.py fail fast at startup.
+_RECORDING_MASKS = compile_pattern(LED_RECORDING_PATTERN)
+_RECORDING_STARTING_MASKS = compile_pattern(LED_RECORDING_STARTING_PATTERN)
+_RECORDING_STARTED_MASKS = compile_pattern(LED_RECORDING_STARTED_PATTERN)
+_WARN1_MASKS = compile_pattern(LED_RECORDING_WARN1_PATTERN)
+_WARN2_MASKS = compile_pattern(LED_RECORDING_WARN2_PATTERN)
+_WARN3_MASKS = compile_pattern(LED_RECORDING_WARN3_PATTERN)
+_EXTENSION_ADDED_MASKS = compile_pattern(LED_EXTENSION_ADDED_PATTERN)
+_ERROR_MASKS = compile_pattern(LED_ERROR_PATTERN)
+
+
+class _Ticker:
+    """
+    Paces an LED animation on an absolute schedule.
+
+    Each wait ends `duration` after the previous deadline, not after "now":
+    the time spent writing the LEDs is absorbed instead of added to every
+    step, so long-running patterns keep their exact rhythm.
+    """
+
+    __slots__ = ("_deadline", "_stop_wait")
+
+    def __init__(self, stop_event: threading.Event):
+        self._stop_wait = stop_event.wait
+        self._deadline = time.monotonic()
+
+    def wait(self, duration: float) -> bool:
+        """
+        Sleep until the next deadline, waking early if stopped.
+
+        Args:
+            duration: Seconds from the previous deadline
+
+        Returns:
+            True if the stop event was set
+        """
+        self._deadline += duration
+        remaining = self._deadline - time.monotonic()
+        if remaining < -duration:
+            # More than a step behind (thread starved) - restart the
+            # schedule from now instead of rushing through missed steps
+            self._deadline = time.monotonic()
+            remaining = 0.0
+        return self._stop_wait(max(0.0, remaining))
+
 
 class LEDController:
     """
@@ -119,6 +169,21 @@ class LEDController:
             LEDColor.RED: GPIO_LED_RED,
         }
 
+        # (mask bit, pin) per LED, in the bit layout compile_pattern() uses
+        self._mask_pins = (
+            (MASK_GREEN, self.pins[LEDColor.GREEN]),
+            (MASK_ORANGE, self.pins[LEDColor.ORANGE]),
+            (MASK_RED, self.pins[LEDColor.RED]),
+        )
+
+        # Mask last written to the G/O/R LEDs (None = unknown, write all)
+        # WHY: consecutive pattern steps usually share most LEDs, and a
+        #   write per unchanged pin is wasted GPIO traffic on every tick
+        # The lock keeps the mask in step with the pins when a flash thread
+        # and the main thread write around the same time
+        self._led_mask: Optional[int] = None
+        self._led_lock = threading.Lock()
+
         # Current state
         self.current_pattern = LEDPattern.OFF
 
@@ -134,6 +199,7 @@ class LEDController:
 
         # Initialize hardware
         self._setup_leds()
+        self._led_mask = 0  # Setup drove every LED pin LOW
 
         # Set initial state (all off)
         self.set_status(LEDPattern.OFF)
@@ -191,14 +257,14 @@ class LEDController:
 
         # Get pattern configuration from constants
         config = LED_PATTERN_CONFIG[pattern]
-        green_on, orange_on, red_on, should_blink, blink_color = config
 
-        if should_blink:
+        if config.should_blink:
             # Use 12-step pattern framework
             if pattern == LEDPattern.RECORDING:
                 # Normal recording - green blink
                 self._start_pattern(
-                    LED_RECORDING_PATTERN,
+                    "recording",
+                    _RECORDING_MASKS,
                     LED_RECORDING_STEP_DURATION,
                     LED_RECORDING_PAUSE_DURATION,
                     repeat_count=None,  # Continuous
@@ -214,7 +280,7 @@ class LEDController:
                 )
         else:
             # Static pattern - just set the LEDs
-            self._set_all_leds(green_on, orange_on, red_on)
+            self._set_all_leds(config.green_on, config.orange_on, config.red_on)
 
     def _set_all_leds(
         self,
@@ -230,63 +296,53 @@ class LEDController:
             orange: True = ON, False = OFF
             red: True = ON, False = OFF
 
-        This is an internal helper - uses the pattern from gpio_utils
-        for consistent state handling.
+        This is an internal helper - see _write_mask().
         """
-        # Convert bool to PinState
-        green_state = PinState.HIGH if green else PinState.LOW
-        orange_state = PinState.HIGH if orange else PinState.LOW
-        red_state = PinState.HIGH if red else PinState.LOW
-
-        # Write to GPIO
-        self.gpio.write(self.pins[LEDColor.GREEN], green_state)
-        self.gpio.write(self.pins[LEDColor.ORANGE], orange_state)
-        self.gpio.write(self.pins[LEDColor.RED], red_state)
-
-        # Log for debugging (only when LEDs actually change)
-        on_leds = []
-        if green:
-            on_leds.append("GREEN")
-        if orange:
-            on_leds.append("ORANGE")
-        if red:
-            on_leds.append("RED")
-
-        if on_leds:
-            self.logger.debug(f"LEDs ON: {', '.join(on_leds)}")
-        else:
-            self.logger.debug("All LEDs OFF")
+        self._write_mask(
+            (MASK_GREEN if green else 0)
+            | (MASK_ORANGE if orange else 0)
+            | (MASK_RED if red else 0),
+        )
 
-    def _start_blinking(
-        self,
-        color: LEDColor,
-        interval: float,
-    ) -> None:
+    def _write_mask(self, mask: int) -> None:
         """
-        Start blinking a specific LED.
+        Set the G/O/R LEDs from a step mask, writing only the ones that change.
 
         Args:
-            color: Which LED to blink (from LEDColor enum)
-            interval: Time between blinks in seconds
+            mask: bit0=Green, bit1=Orange, bit2=Red (compile_pattern() layout)
         """
-        # Ensure no thread is already running
-        self._stop_blinking()
-
-        # Reset stop event
-        self._blink_stop_event.clear()
+        with self._led_lock:
+            last = self._led_mask
+            if mask == last:
+                return
 
-        # Start new blink thread
-        self._blink_thread = threading.Thread(
-            target=self._blink_worker,
-            args=(color, interval),
-            daemon=True,
-            name=f"LED-Blink-{color.value}",
-        )
-        self._blink_thread.start()
+            # Nothing known about the pins yet: write all three
+            changed = 0b111 if last is None else mask ^ last
+            write = self.gpio.write
+            for bit, pin in self._mask_pins:
+                if changed & bit:
+                    write(pin, PinState.HIGH if mask & bit else PinState.LOW)
+            self._led_mask = mask
+
+        # Log for debugging (only when LEDs actually change). WHY the level
+        # check: this runs on every blink step, so skip building the name
+        # list and the f-string when nobody will see the message.
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
 
-        self.logger.debug(
-            f"Started blinking {color.value} LED at {1/interval:.1f}Hz",
-        )
+        on_leds = [
+            name
+            for bit, name in (
+                (MASK_GREEN, "GREEN"),
+                (MASK_ORANGE, "ORANGE"),
+                (MASK_RED, "RED"),
+            )
+            if mask & bit
+        ]
+        if on_leds:
+            self.logger.debug(f"LEDs ON: {', '.join(on_leds)}")
+        else:
+            self.logger.debug("All LEDs OFF")
 
     def _stop_blinking(self) -> None:
         """Stop any current blinking pattern."""
@@ -298,7 +354,8 @@ class LEDController:
 
     def _start_pattern(
         self,
-        pattern: str,
+        name: str,
+        pattern: Tuple[int, ...],
         step_duration: float,
         pause_duration: float,
         repeat_count: Optional[int] = None,
@@ -307,7 +364,8 @@ class LEDController:
         Start a pattern animation using the universal pattern engine.
 
         Args:
-            pattern: 12-step pattern string (e.g., "G-x-G-x-G-x-G-x-G-x-G-x")
+            name: Pattern name for logging (the masks alone are unreadable)
+            pattern: 12 step masks from compile_pattern()
             step_duration: Seconds per step
             pause_duration: Seconds of blank gap between cycles
             repeat_count: Number of cycles (None = infinite)
@@ -328,14 +386,14 @@ class LEDController:
         self._blink_thread.start()
 
         self.logger.debug(
-            f"Started pattern: {pattern[:20]}... "
+            f"Started pattern: {name} "
             f"(step={step_duration}s, pause={pause_duration}s, "
             f"repeat={repeat_count if repeat_count else 'infinite'})",
         )
 
     def _pattern_worker(
         self,
-        pattern: str,
+        pattern: Tuple[int, ...],
         step_duration: float,
         pause_duration: float,
         repeat_count: Optional[int] = None,
@@ -344,57 +402,49 @@ class LEDController:
         Universal pattern execution engine.
 
         All LED animations use this single worker.
-        Parses pattern string and executes LED state sequences.
+        Executes precompiled LED masks step by step.
 
         Args:
-            pattern: 12-step pattern string
+            pattern: 12 step masks from compile_pattern()
             step_duration: Seconds per step
             pause_duration: Seconds between cycles
             repeat_count: Number of cycles (None = infinite)
 
-        Pattern Format:
-            "G-O-R-GOR-x-x-G-O-R-GOR-x-x"
-            - 12 steps separated by "-"
-            - G=Green, O=Orange, R=Red, x=Blank
-            - Multi-LED: GO, GOR, OR, GR
-
-        Examples:
-            "G-x-G-x-G-x-G-x-G-x-G-x" → Simple blink
-            "GO-x-GO-x-GO-x-GO-x-GO-x-GO-x" → Green+Orange blink
-            "G-O-R-GOR-G-O-R-GOR-x-x-x-x" → Complex sequence
-        """
-        try:
-            # Parse pattern to LED states
-            led_states = parse_pattern(pattern)
-        except PatternParseError as e:
-            self.logger.error(f"Invalid pattern: {e}")
-            return
-
+        Mask Format:
+            One int per step: bit0=Green, bit1=Orange, bit2=Red
+            "G-O-R-GOR-x-x-..." compiles to (1, 2, 4, 7, 0, 0, ...)
+        """
         cycle_count = 0
 
+        # WHY local bindings: this loop runs for the whole recording, so resolve
+        # the attribute lookups once instead of on every 12-step tick
+        write_mask = self._write_mask
+        stop_event = self._blink_stop_event
+        stop_wait = _Ticker(stop_event).wait
+
         # Execute pattern cycles
-        while not self._blink_stop_event.is_set():
+        while not stop_event.is_set():
             # Execute 12 steps
-            for green, orange, red in led_states:
-                self._set_all_leds(green, orange, red)
+            for mask in pattern:
+                write_mask(mask)
 
                 # Check for stop during step
-                if self._blink_stop_event.wait(step_duration):
-                    self._set_all_leds(False, False, False)  # Turn off on exit
+                if stop_wait(step_duration):
+                    write_mask(0)  # Turn off on exit
                     return
 
             # Pause between cycles (if configured)
             if pause_duration > 0:
-                self._set_all_leds(False, False, False)
+                write_mask(0)
 
                 # Check for stop during pause
-                if self._blink_stop_event.wait(pause_duration):
+                if stop_wait(pause_duration):
                     return
 
             # Check repeat limit
             cycle_count += 1
             if repeat_count is not None and cycle_count >= repeat_count:
-                self._set_all_leds(False, False, False)
+                write_mask(0)
                 self.logger.debug(
                     f"Pattern completed {cycle_count} cycles, stopping",
                 )
@@ -450,7 +500,8 @@ class LEDController:
 
         # Execute error pattern
         self._start_pattern(
-            LED_ERROR_PATTERN,
+            "error",
+            _ERROR_MASKS,
             LED_ERROR_STEP_DURATION,
             LED_ERROR_PAUSE_DURATION,
             repeat_count=repeat_count,
@@ -509,7 +560,8 @@ class LEDController:
 
         # Execute extension pattern
         self._start_pattern(
-            LED_EXTENSION_ADDED_PATTERN,
+            "extension_added",
+            _EXTENSION_ADDED_MASKS,
             LED_EXTENSION_ADDED_STEP_DURATION,
             LED_EXTENSION_ADDED_PAUSE_DURATION,
             repeat_count=LED_EXTENSION_ADDED_REPEAT_COUNT,
@@ -561,7 +613,8 @@ class LEDController:
 
         # Execute recording started pattern
         self._start_pattern(
-            LED_RECORDING_STARTED_PATTERN,
+            "recording_started",
+            _RECORDING_STARTED_MASKS,
             LED_RECORDING_STARTED_STEP_DURATION,
             LED_RECORDING_STARTED_PAUSE_DURATION,
             repeat_count=LED_RECORDING_STARTED_REPEAT_COUNT,
@@ -599,7 +652,8 @@ class LEDController:
 
         # Start continuous starting pattern (no repeat limit)
         self._start_pattern(
-            LED_RECORDING_STARTING_PATTERN,
+            "recording_starting",
+            _RECORDING_STARTING_MASKS,
             LED_RECORDING_STARTING_STEP_DURATION,
             LED_RECORDING_STARTING_PAUSE_DURATION,
             repeat_count=None,  # Continuous until interrupted
@@ -637,20 +691,24 @@ class LEDController:
 
         # Select pattern based on level
         if level == 1:
-            pattern = LED_RECORDING_WARN1_PATTERN
+            name = "warning_1"
+            pattern = _WARN1_MASKS
             step_duration = LED_RECORDING_WARN1_STEP_DURATION
             pause_duration = LED_RECORDING_WARN1_PAUSE_DURATION
         elif level == 2:
-            pattern = LED_RECORDING_WARN2_PATTERN
+            name = "warning_2"
+            pattern = _WARN2_MASKS
             step_duration = LED_RECORDING_WARN2_STEP_DURATION
             pause_duration = LED_RECORDING_WARN2_PAUSE_DURATION
         else:  # level 3 (default)
-            pattern = LED_RECORDING_WARN3_PATTERN
+            name = "warning_3"
+            pattern = _WARN3_MASKS
             step_duration = LED_RECORDING_WARN3_STEP_DURATION
             pause_duration = LED_RECORDING_WARN3_PAUSE_DURATION
 
         # Start warning pattern (continuous, no repeat limit)
         self._start_pattern(
+            name,
             pattern,
             step_duration,
             pause_duration,
@@ -789,6 +847,7 @@ class LEDController:
         blink_interval = LED_UPLOAD_BLINK_INTERVAL
         brightness_high = PinState.HIGH
         brightness_low = PinState.LOW
+        stop_wait = _Ticker(self._upload_blink_event).wait
 
         # WHY Event-driven timing instead of simple sleep()?
         # Context: Need responsive shutdown when upload finishes
@@ -799,11 +858,12 @@ class LEDController:
         #   Result: LED stops blinking IMMEDIATELY when upload done,
         #           instead of waiting up to 0.5s for sleep to complete
         # Pattern: .wait(timeout) returns False if timeout, True if set
-        while not self._upload_blink_event.wait(blink_interval):
+        # (_Ticker keeps the waits on a fixed schedule - no drift)
+        while not stop_wait(blink_interval):
             # Blink: ON for interval
             self.gpio.write(GPIO_LED_BLUE, brightness_high)
 
-            if self._upload_blink_event.wait(blink_interval):
+            if stop_wait(blink_interval):
                 break
 
             # Blink: OFF for interval
@@ -117,7 +117,9 @@ class MockGPIO(GPIOInterface):
             "edge": edge,
             "callback": callback,
             "debounce_ms": debounce_ms,
-            "last_trigger": 0,  # Timestamp of last trigger (for debouncing)
+            # time.monotonic() of last trigger (for debouncing); -inf so the
+            # first edge always passes
+            "last_trigger": float("-inf"),
         }
 
         self.logger.debug(
@@ -198,6 +200,25 @@ class MockGPIO(GPIOInterface):
         self.simulate_button_press(pin)
         self.logger.info(f"[MOCK] Simulated DOUBLE press on pin {pin}")
 
+    def simulate_edge(self, pin: int, state: PinState) -> None:
+        """
+        Drive an input pin to a level, firing its edge callback if it changed.
+
+        Lets tests script contact bounce and glitches edge by edge, subject
+        to the same bouncetime filtering as a real edge.
+
+        Args:
+            pin: Input pin number
+            state: New pin level
+        """
+        if pin not in self._pins or self._pins[pin]["mode"] != "input":
+            raise GPIOError(f"Pin {pin} not configured as input")
+
+        if pin in self._callbacks:
+            self._trigger_edge_event(pin, state)
+        else:
+            self._pins[pin]["state"] = state
+
     def _trigger_edge_event(self, pin: int, new_state: PinState) -> None:
         """
         Internal method to trigger edge detection callback.
@@ -237,7 +258,9 @@ class MockGPIO(GPIOInterface):
             return
 
         # Apply debouncing (ignore if too soon after last trigger)
-        current_time = time.time()
+        # Monotonic: a wall-clock step (NTP) must not open or stretch the
+        # debounce window
+        current_time = time.monotonic()
         debounce_seconds = callback_info["debounce_ms"] / 1000.0
 
         if current_time - callback_info["last_trigger"] < debounce_seconds:
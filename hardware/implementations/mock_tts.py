@@ -58,7 +58,7 @@ class MockTTS(TTSInterface):
         If simulate_timing is True, delays to mimic real speech duration.
         This tests queue behavior without actual audio.
         """
-        if not text.strip():
+        if not text or text.isspace():
             self.logger.warning("[MOCK TTS] Empty text provided")
             return
 
@@ -9,11 +9,23 @@ Why wrap pyttsx3?
 2. Easy to swap for other TTS (Google Cloud TTS, Amazon Polly, etc.)
 3. Easier testing with MockTTS
 4. Clean error handling
+
+WAV cache:
+Each predefined message (AudioMessage, plus any text passed to
+prerender()) is synthesized ONCE to a WAV file (keyed by text, voice, rate
+and volume) and replayed with `aplay` afterwards. That set is small and
+fixed, so the cache stays bounded; arbitrary text (durations, counts, error
+details) is spoken live and never written to the SD card. Without `aplay`
+(e.g. macOS dev machines) all speech falls back to live pyttsx3 playback.
 """
 
+import hashlib
 import logging
+import shutil
+import subprocess
 import time
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import pyttsx3
@@ -22,6 +34,8 @@ try:
 except ImportError:
     TTS_AVAILABLE = False
 
+from config.settings import TTS_CACHE_DIR
+from hardware.constants import AudioMessage
 from hardware.interfaces.tts_interface import TTSError, TTSInterface
 
 
@@ -30,11 +44,13 @@ class PyTTSx3Engine(TTSInterface):
     Text-to-Speech implementation using pyttsx3 library.
 
     pyttsx3 issues:
-    - Engine instances can have thread safety issues
-    - Keeping engines around can cause audio cutoff
-    - Best practice: Create fresh engine for each speech
+    - Engine instances are not thread-safe
+    - Engine creation is slow (loads the driver, probes voices)
+    - A freshly created engine needs a moment before it can speak
 
-    This wrapper handles these quirks so AudioController doesn't have to.
+    This wrapper handles these quirks so AudioController doesn't have to:
+    one engine is created lazily on the audio worker thread (the only thread
+    that speaks) and reused, so creation and its settle delay happen once.
     """
 
     def __init__(self):
@@ -45,14 +61,34 @@ class PyTTSx3Engine(TTSInterface):
                 "pyttsx3 not available. Install with: pip install pyttsx3",
             )
 
-        # Store configuration instead of keeping an engine instance
-        # This prevents thread safety issues and audio cutoff
+        # Requested configuration - set_*() may be called from any thread, so
+        # it is only recorded here and applied to the engine by the worker
         self._config = {
             "rate": 125,
             "volume": 0.8,
             "voice_id": None,
         }
 
+        # Long-lived engine, created lazily on the audio worker thread
+        # (pyttsx3 engines aren't thread-safe; AudioQueue is the only caller)
+        self._engine: Optional[pyttsx3.Engine] = None
+        self._applied_config: Dict[str, Any] = {}
+
+        # WAV cache (disabled when aplay isn't installed)
+        self._cache_dir = TTS_CACHE_DIR
+        self._aplay_path = shutil.which("aplay")
+
+        # Texts allowed into the WAV cache: the predefined messages, plus
+        # whatever prerender() is asked for (e.g. customised library texts)
+        # WHY not every text: play_text() strings are mostly one-offs, and
+        #   caching them would grow the cache on the SD card without bound
+        self._cacheable: Set[str] = {message.text for message in AudioMessage}
+
+        # Installed voice IDs, memoized on first successful query
+        # WHY: listing voices means creating a throwaway engine (slow), and
+        #   the installed voices don't change while the service runs
+        self._voice_ids: Optional[List[str]] = None
+
         # Initialize voice configuration
         self._initialize_voice_config()
 
@@ -69,6 +105,9 @@ class PyTTSx3Engine(TTSInterface):
             temp_engine = pyttsx3.init()
             voices = temp_engine.getProperty("voices")
 
+            # Seed the voice cache so get_available_voices() needs no engine
+            self._voice_ids = [voice.id for voice in voices] if voices else []
+
             if voices:
                 # Try to find a French voice (for your project)
                 for voice in voices:
@@ -88,45 +127,55 @@ class PyTTSx3Engine(TTSInterface):
             self.logger.warning(f"Could not initialize voice config: {e}")
             # Continue anyway - speak() will try again
 
-    def _create_engine(self) -> pyttsx3.Engine:
+    def _get_engine(self) -> pyttsx3.Engine:
         """
-        Create a fresh TTS engine with current configuration.
+        Get the long-lived TTS engine, creating it on first use.
 
-        Why create a new engine each time?
-        - Prevents audio cutoff issues
-        - Avoids thread safety problems
-        - Ensures clean state for each speech
+        Called only from the audio worker thread (AudioQueue serialises all
+        speech), so one engine is reused for every utterance. Configuration
+        changes made via set_rate()/set_volume()/set_voice() are applied
+        lazily here, before the next utterance.
 
-        Trade-off: Slightly slower, but much more reliable.
+        Raises:
+            TTSError: If the engine cannot be created
         """
-        try:
-            engine = pyttsx3.init()
-
-            # Apply configuration
-            if self._config["voice_id"]:
-                engine.setProperty("voice", self._config["voice_id"])
-            engine.setProperty("rate", self._config["rate"])
-            engine.setProperty("volume", self._config["volume"])
-
-            # DELAY 0: 0.1 seconds after engine creation
-            # WHY 0.1s (100ms): Allows underlying TTS engine to fully
-            #   initialize
-            # Context: Platform TTS engines (espeak/SAPI/nsss) need time to
-            #   load voice data and initialize audio drivers after
-            #   setProperty() calls
-            # Tradeoff: 100ms delay is imperceptible but prevents
-            #   initialization race conditions
-            # Risk: Without this, engine.say() might be called before audio
-            #   subsystem is ready, causing either silence or crashes on some
-            #   platforms (especially Raspberry Pi)
-            # Source: This is a documented quirk in pyttsx3 - engine is
-            #   "ready" but not *actually* ready
+        if self._engine is None:
+            try:
+                self._engine = pyttsx3.init()
+            except Exception as e:
+                raise TTSError(f"Failed to create TTS engine: {e}") from e
+
+            self._applied_config = {}
+
+            # ONE-TIME settle delay after engine creation
+            # WHY 0.1s: Platform TTS engines (espeak/SAPI/nsss) need time to
+            #   load voice data and initialize audio drivers; speaking right
+            #   away can produce silence or a clipped first syllable on the Pi
+            # Now paid once per process instead of once per message
             time.sleep(0.1)
 
-            return engine
-
-        except Exception as e:
-            raise TTSError(f"Failed to create TTS engine: {e}") from e
+        # Apply only the properties that changed since the last utterance
+        for name, prop in (
+            ("voice_id", "voice"),
+            ("rate", "rate"),
+            ("volume", "volume"),
+        ):
+            value = self._config[name]
+            if value is not None and self._applied_config.get(name) != value:
+                self._engine.setProperty(prop, value)
+                self._applied_config[name] = value
+
+        return self._engine
+
+    def _discard_engine(self) -> None:
+        """Drop the engine after a failure so the next call starts fresh."""
+        if self._engine is not None:
+            try:
+                self._engine.stop()
+            except Exception:
+                pass  # Ignore errors during cleanup
+        self._engine = None
+        self._applied_config = {}
 
     def speak(self, text: str) -> None:
         """
@@ -134,71 +183,152 @@ class PyTTSx3Engine(TTSInterface):
 
         This is BLOCKING - doesn't return until speech finishes.
         AudioController handles making it non-blocking via queue.
+
+        Predefined phrases play from the WAV cache (rendered on first use);
+        any other text is spoken live through pyttsx3.
         """
-        if not text.strip():
+        if not text or text.isspace():
             self.logger.warning("Empty text provided for speech")
             return
 
-        engine = None
-        try:
-            # Create fresh engine for this speech
-            engine = self._create_engine()
+        if self._aplay_path and text in self._cacheable:
+            wav_path = self._get_cached_wav(text)
+            if wav_path is not None:
+                self._play_wav(wav_path)
+                return
 
-            # Queue the text
-            engine.say(text)
+        self._speak_live(text)
+
+    def prerender(self, text: str) -> None:
+        """
+        Render text into the WAV cache ahead of time.
+
+        Also marks the text as cacheable, so later speak() calls replay it.
+        A no-op when the cached WAV already exists or aplay isn't available
+        (cached WAVs couldn't be played anyway).
+
+        Args:
+            text: Text that is likely to be spoken later
+        """
+        if self._aplay_path:
+            self._cacheable.add(text)
+            # Failures are logged inside; speak() renders lazily as fallback
+            self._get_cached_wav(text)
+
+    def _speak_live(self, text: str) -> None:
+        """
+        Speak text directly through the long-lived pyttsx3 engine.
 
-            # WHY these specific delay values: Work around pyttsx3 audio timing
-            #   quirks
-            # Context: pyttsx3 has known issues with audio cutoff and timing
-            #   across platforms. These delays are empirically determined
-            #   workarounds for library bugs
-            # Background: pyttsx3 wraps platform TTS engines (espeak/SAPI/nsss)
-            #   which have different timing behaviors. The library doesn't
-            #   always wait for audio buffers to fully initialize or drain.
-
-            # DELAY 1: 0.05 seconds BEFORE runAndWait()
-            # WHY 0.05s (50ms): Allows audio subsystem to initialize before
-            #   playback starts
-            # Context: Without this, first syllable sometimes gets clipped on
-            #   Linux (espeak)
-            # Tradeoff: 50ms is imperceptible to users but prevents audio
-            #   cutoff
-            # Source: Common workaround in pyttsx3 GitHub issues #78, #118,
-            #   #234
-            # Risk: Too short (< 20ms) = still get cutoff; Too long (> 200ms)
-            #   = noticeable pause
-            time.sleep(0.05)
+        Args:
+            text: Text to speak
+        """
+        try:
+            engine = self._get_engine()
+            engine.say(text)
 
             # This blocks until speech completes
             engine.runAndWait()
 
-            # DELAY 2: 0.1 seconds AFTER runAndWait()
-            # WHY 0.1s (100ms): Ensures audio buffer fully drains before
-            #   engine cleanup
-            # Context: runAndWait() sometimes returns slightly before audio
-            #   finishes playing. Deleting engine too quickly can truncate
-            #   final syllables
-            # Tradeoff: Small delay ensures clean audio completion
-            # Source: Recommended in pyttsx3 docs and multiple GitHub issues
-            # Risk: Without this delay, last word can be cut off when engine
-            #   is deleted
-            # Alternative: Could use engine.endLoop() but it's not reliable
-            #   across platforms
-            time.sleep(0.1)
-
             self.logger.debug(f"Spoke: '{text[:30]}...'")
 
         except Exception as e:
+            # Engine state is unknown after a failure - rebuild next time
+            self._discard_engine()
             raise TTSError(f"Speech failed: {e}") from e
 
-        finally:
-            # Always clean up the engine
-            if engine:
-                try:
-                    engine.stop()
-                except Exception:
-                    pass  # Ignore errors during cleanup
-                del engine
+    def _cache_path(self, text: str) -> Path:
+        """
+        Get the WAV cache path for text under the current voice settings.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            Path of the cache file (may not exist yet)
+        """
+        # Voice/rate/volume are part of the key so a settings change never
+        # replays audio rendered with the old settings
+        key = (
+            f"{self._config['voice_id']}|{self._config['rate']}|"
+            f"{self._config['volume']}|{text}"
+        )
+        digest = hashlib.sha1(
+            key.encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        return self._cache_dir / f"{digest}.wav"
+
+    def _get_cached_wav(self, text: str) -> Optional[Path]:
+        """
+        Get the cached WAV for text, rendering it on a cache miss.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            Path to a playable WAV, or None if rendering failed
+        """
+        wav_path = self._cache_path(text)
+        if wav_path.exists():
+            return wav_path
+
+        try:
+            self._render_wav(text, wav_path)
+            return wav_path
+        except Exception as e:
+            self.logger.warning(f"Could not cache speech, speaking live: {e}")
+            return None
+
+    def _render_wav(self, text: str, wav_path: Path) -> None:
+        """
+        Synthesize text into a WAV file with pyttsx3.
+
+        Args:
+            text: Text to synthesize
+            wav_path: Destination file
+
+        Raises:
+            TTSError: If synthesis produced no audio
+        """
+        wav_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Render to a temp name, then rename: a crash mid-render never leaves
+        # a truncated file that would be replayed forever
+        tmp_path = wav_path.with_suffix(".tmp")
+
+        try:
+            engine = self._get_engine()
+            engine.save_to_file(text, str(tmp_path))
+            engine.runAndWait()
+        except Exception:
+            self._discard_engine()
+            raise
+
+        if not tmp_path.exists() or tmp_path.stat().st_size == 0:
+            tmp_path.unlink(missing_ok=True)
+            raise TTSError(f"No audio rendered for: '{text[:30]}...'")
+
+        tmp_path.replace(wav_path)
+        self.logger.debug(f"Cached speech: '{text[:30]}...' → {wav_path.name}")
+
+    def _play_wav(self, wav_path: Path) -> None:
+        """
+        Play a WAV file with aplay (blocking).
+
+        Args:
+            wav_path: WAV file to play
+
+        Raises:
+            TTSError: If playback fails
+        """
+        try:
+            subprocess.run(
+                [self._aplay_path, "-q", str(wav_path)],
+                check=True,
+                timeout=60,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            raise TTSError(f"WAV playback failed: {e}") from e
 
     def set_rate(self, rate: int) -> None:
         """
@@ -262,14 +392,17 @@ class PyTTSx3Engine(TTSInterface):
         Returns:
             List of voice identifier strings
         """
+        if self._voice_ids is not None:
+            # Copy so callers can't mutate the cache
+            return list(self._voice_ids)
+
         try:
             temp_engine = pyttsx3.init()
             voices = temp_engine.getProperty("voices")
             del temp_engine
 
-            if voices:
-                return [voice.id for voice in voices]
-            return []
+            self._voice_ids = [voice.id for voice in voices] if voices else []
+            return list(self._voice_ids)
 
         except Exception as e:
             self.logger.error(f"Failed to get voices: {e}")
@@ -283,7 +416,7 @@ class PyTTSx3Engine(TTSInterface):
         """
         Clean up TTS resources.
 
-        Since we create fresh engines each time, there's nothing to clean up.
-        But we implement this for interface compliance.
+        Stops and releases the long-lived engine (if one was created).
         """
-        self.logger.debug("TTS cleanup (nothing to clean with fresh engines)")
+        self._discard_engine()
+        self.logger.debug("TTS cleanup complete")
@@ -89,6 +89,18 @@ class TTSInterface(ABC):
             True if TTS hardware/software is working, False otherwise
         """
 
+    def prerender(self, text: str) -> None:  # noqa: B027
+        """
+        Prepare text so a later speak() starts faster (optional).
+
+        Engines that can render speech ahead of time (e.g. to a WAV cache)
+        override this; the default does nothing. Called from the audio
+        worker thread, like speak(), and only while no speech is pending.
+
+        Args:
+            text: Text that is likely to be spoken later
+        """
+
     @abstractmethod
     def cleanup(self) -> None:
         """
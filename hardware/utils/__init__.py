@@ -15,6 +15,7 @@ Public API:
 
     Pattern utilities:
     - parse_pattern: Parse 12-step LED pattern string to states
+    - compile_pattern: Compile pattern string to per-step LED bitmasks
     - validate_pattern: Validate pattern format
     - get_pattern_info: Get pattern statistics
     - PatternParseError: Exception for invalid patterns
@@ -38,7 +39,11 @@ from hardware.utils.gpio_utils import (
     validate_pin_number,
 )
 from hardware.utils.pattern_parser import (
+    MASK_GREEN,
+    MASK_ORANGE,
+    MASK_RED,
     PatternParseError,
+    compile_pattern,
     get_pattern_info,
     parse_pattern,
     validate_pattern,
@@ -46,10 +51,14 @@ from hardware.utils.pattern_parser import (
 
 # Public API
 __all__ = [
-    # Exception classes (capitalized, sorted first)
+    # Constants and exception classes (capitalized, sorted first)
+    "MASK_GREEN",
+    "MASK_ORANGE",
+    "MASK_RED",
     "PatternParseError",
     # Functions (sorted alphabetically)
     "check_gpio_available",
+    "compile_pattern",
     "get_pattern_info",
     "parse_pattern",
     "read_pin_as_bool",
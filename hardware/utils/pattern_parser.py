@@ -28,6 +28,11 @@ from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Bit positions used by compile_pattern() masks (one bit per LED)
+MASK_GREEN = 0b001
+MASK_ORANGE = 0b010
+MASK_RED = 0b100
+
 
 class PatternParseError(ValueError):
     """Raised when pattern string is invalid."""
@@ -132,6 +137,39 @@ def _parse_step(step: str) -> Tuple[bool, bool, bool]:
     return (green, orange, red)
 
 
+def compile_pattern(pattern: str) -> Tuple[int, ...]:
+    """
+    Compile pattern string to a tuple of 3-bit LED masks.
+
+    Same validation as parse_pattern(), but each step is packed into one
+    int (bit0=Green, bit1=Orange, bit2=Red) so animation loops only need
+    a tuple index and a bitwise AND per LED.
+
+    Args:
+        pattern: 12-step pattern string (e.g., "G-x-G-x-G-x-G-x-G-x-G-x")
+
+    Returns:
+        Tuple of 12 ints, one mask per step
+
+    Raises:
+        PatternParseError: If pattern format is invalid
+
+    Example:
+        >>> compile_pattern("G-O-R-GOR-x-x-G-O-R-GOR-x-x")
+        (1, 2, 4, 7, 0, 0, 1, 2, 4, 7, 0, 0)
+    """
+    # WHY compile once instead of parsing per cycle?
+    # Context: Patterns are fixed config - parsing them again on every
+    #   animation cycle is wasted string work on the Pi's LED thread
+    # Callers compile at import time and keep the tuple around
+    return tuple(
+        (MASK_GREEN if green else 0)
+        | (MASK_ORANGE if orange else 0)
+        | (MASK_RED if red else 0)
+        for green, orange, red in parse_pattern(pattern)
+    )
+
+
 def validate_pattern(pattern: str) -> Tuple[bool, str]:
     """
     Validate pattern string without raising exceptions.
@@ -32,6 +32,7 @@ Upload Queue:
 - Silent on success, logs failures
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
@@ -41,10 +42,11 @@ import signal
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Optional
 
 from config.settings import (
     CLEANUP_INTERVAL_SECONDS,
@@ -54,16 +56,15 @@ from config.settings import (
     HEARTBEAT_FILE,
     HEARTBEAT_INTERVAL,
     MAX_UPLOAD_RETRIES,
-    NETWORK_CHECK_INTERVAL,
+    PENDING_DIR,
     RESTART_COUNTER_FILE,
     RETRY_DELAY_SECONDS,
-    STORAGE_BASE_PATH,
     WARNING_TIME_1,
     WARNING_TIME_2,
     WARNING_TIME_3,
     YOUTUBE_PLAYLIST_ID,
 )
-from core.network import check_internet_connectivity
+from core.network import NetworkMonitor
 from hardware import ButtonController, LEDController
 from hardware.constants import LEDPattern
 from recording import CameraManager, RecordingSession, generate_filename
@@ -110,18 +111,30 @@ class RecorderService:
         self.logger.info("Initializing Recorder Service...")
 
         # State tracking
+        # WHY monotonic for all durations/intervals in this service: the Pi
+        # has no RTC and NTP steps the wall clock after boot, which would
+        # corrupt any time.time() difference taken across the sync
         self.state = SystemState.BOOTING
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
         self.running = False
         self.error_count = 0  # Track total errors (red LED activations)
 
+        # Button dispatch table: state → handler (BOOTING has none, press ignored)
+        # WHY: one lookup per press instead of walking an if/elif chain
+        self._button_handlers = {
+            SystemState.READY: self._handle_button_ready,
+            SystemState.RECORDING: self._handle_button_recording,
+            SystemState.PROCESSING: self._handle_button_processing,
+            SystemState.ERROR: self._handle_button_error,
+        }
+
         # Restart counter (persistent across service restarts)
         self.restart_counter_file = Path(RESTART_COUNTER_FILE)
         self.restart_count = self._increment_restart_counter()
 
         # Heartbeat setup for liveness monitoring
         self.heartbeat_file = Path(HEARTBEAT_FILE)
-        self.last_heartbeat = time.time()
+        self.last_heartbeat = time.monotonic()
 
         # Remote control file for SSH/script commands
         self.control_file = Path(CONTROL_FILE)
@@ -132,18 +145,21 @@ class RecorderService:
         self.session_start_time: Optional[float] = None
 
         # Upload queue management
-        self.upload_queue: queue.Queue = queue.Queue()
+        # WHY deque + Event: one producer (main thread) and one consumer (upload
+        # worker); deque append/popleft are already atomic, so queue.Queue's
+        # mutex adds nothing - the Event only wakes the worker early
+        self.upload_queue: Deque[VideoFile] = deque()
+        self._upload_wake = threading.Event()
         self.upload_worker_thread: Optional[threading.Thread] = None
         self.currently_uploading: Optional[VideoFile] = None
         self.upload_lock = threading.Lock()
 
         # Cleanup worker
         self.cleanup_worker_thread: Optional[threading.Thread] = None
-        self.last_cleanup_time = time.time()
+        self.last_cleanup_time = time.monotonic()
 
-        # Network monitoring worker
-        self.network_monitor_thread: Optional[threading.Thread] = None
-        self.internet_connected = False  # Track internet connectivity status
+        # Network monitoring (background thread, cached status)
+        self.network_monitor = NetworkMonitor()
 
         # Initialize hardware controllers
         self.logger.info("Initializing hardware controllers...")
@@ -178,6 +194,9 @@ class RecorderService:
         self.storage.on_low_space = self._handle_low_space
         self.storage.on_storage_error = self._handle_storage_error
 
+        # Network callback - keep WHITE LED in sync with connectivity
+        self.network_monitor.on_check = self.led.set_network_status
+
         # Recording session callbacks will be set when session starts
         # (on_warning, on_complete callbacks)
 
@@ -194,7 +213,8 @@ class RecorderService:
         # Start background workers
         self._start_upload_worker()
         self._start_cleanup_worker()
-        self._start_network_monitor()
+        self.logger.info("Starting network monitor...")
+        self.network_monitor.start()
 
         # Transition from BOOTING to READY
         self._transition_to_ready()
@@ -219,7 +239,7 @@ class RecorderService:
         - Error conditions
         """
         # Write heartbeat for liveness monitoring
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_heartbeat >= HEARTBEAT_INTERVAL:
             self._write_heartbeat()
             self.last_heartbeat = current_time
@@ -228,7 +248,7 @@ class RecorderService:
         self._check_control_commands()
 
         # If recording, check session health
-        if self.state == SystemState.RECORDING and self.current_session:
+        if self.state is SystemState.RECORDING and self.current_session:
             # RecordingSession handles its own timing and warnings
             # We just need to check if camera is still healthy
             if not self.camera.is_recording():
@@ -284,10 +304,10 @@ class RecorderService:
         try:
             heartbeat = {
                 "timestamp": datetime.now().isoformat(),
-                "uptime_seconds": time.time() - self.state_start_time,
+                "uptime_seconds": time.monotonic() - self.state_start_time,
                 "state": self.state.value,
                 "recording_active": self.current_session is not None,
-                "upload_queue_size": self.upload_queue.qsize(),
+                "upload_queue_size": len(self.upload_queue),
                 "currently_uploading": (
                     self.currently_uploading.filename
                     if self.currently_uploading
@@ -296,7 +316,7 @@ class RecorderService:
                 "pid": os.getpid(),
                 "error_count": self.error_count,
                 "restart_count": self.restart_count,
-                "internet_connected": self.internet_connected,
+                "internet_connected": self.network_monitor.is_online(),
             }
 
             # Atomic write (write to temp file, then rename)
@@ -370,7 +390,7 @@ class RecorderService:
             command: Command string (START, STOP, EXTEND, STATUS)
         """
         if command == "START":
-            if self.state == SystemState.READY:
+            if self.state is SystemState.READY:
                 self.logger.info("Remote START → starting recording")
                 self._start_recording()
             else:
@@ -380,7 +400,7 @@ class RecorderService:
                 )
 
         elif command == "STOP":
-            if self.state == SystemState.RECORDING:
+            if self.state is SystemState.RECORDING:
                 self.logger.info("Remote STOP → stopping recording")
                 self._stop_recording()
             else:
@@ -390,7 +410,7 @@ class RecorderService:
                 )
 
         elif command == "EXTEND":
-            if self.state == SystemState.RECORDING:
+            if self.state is SystemState.RECORDING:
                 self.logger.info("Remote EXTEND → extending recording")
                 self._extend_recording()
             else:
@@ -403,7 +423,7 @@ class RecorderService:
             self.logger.info(
                 f"Remote STATUS → state: {self.state.value}, "
                 f"recording: {self.current_session is not None}, "
-                f"queue: {self.upload_queue.qsize()}",
+                f"queue: {len(self.upload_queue)}",
             )
 
         else:
@@ -422,7 +442,7 @@ class RecorderService:
         """
         self.logger.info("Transitioning to READY state")
         self.state = SystemState.READY
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
 
         # Update LED status (silent - no audio)
         self.led.set_status(LEDPattern.READY)
@@ -433,7 +453,7 @@ class RecorderService:
         """Start recording session."""
         self.logger.info("Transitioning to RECORDING state")
         self.state = SystemState.RECORDING
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
 
         # Flash to indicate recording started, then show recording pattern
         self.led.flash_recording_started()
@@ -452,7 +472,7 @@ class RecorderService:
         """
         self.logger.info("Transitioning to PROCESSING state")
         self.state = SystemState.PROCESSING
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
 
         # Update LED to orange (brief busy indicator)
         self.led.set_status(LEDPattern.PROCESSING)
@@ -467,7 +487,7 @@ class RecorderService:
         self.logger.error(f"Transitioning to ERROR state: {error_message}")
         self.error_count += 1  # Increment error counter for metrics
         self.state = SystemState.ERROR
-        self.state_start_time = time.time()
+        self.state_start_time = time.monotonic()
 
         # Update hardware - red LED (silent - no audio)
         self.led.set_status(LEDPattern.ERROR)
@@ -486,17 +506,16 @@ class RecorderService:
             press_type: "short" or "long"
         """
         press = ButtonPress.SHORT if press_type == "short" else ButtonPress.LONG
-        self.logger.info(f"Button press: {press_type} in state {self.state.value}")
-
-        # Delegate to state-specific handlers
-        if self.state == SystemState.READY:
-            self._handle_button_ready(press)
-        elif self.state == SystemState.RECORDING:
-            self._handle_button_recording(press)
-        elif self.state == SystemState.PROCESSING:
-            self._handle_button_processing(press)
-        elif self.state == SystemState.ERROR:
-            self._handle_button_error(press)
+
+        # Read state once: logging and dispatch must agree even if another
+        # thread (session complete, remote control) transitions meanwhile
+        state = self.state
+        self.logger.info(f"Button press: {press_type} in state {state.value}")
+
+        # Delegate to state-specific handler
+        handler = self._button_handlers.get(state)
+        if handler is not None:
+            handler(press)
 
     def _handle_button_ready(self, press: ButtonPress):
         """
@@ -520,9 +539,9 @@ class RecorderService:
         Short press: Stop recording
         Long press: Extend recording by 5 minutes
         """
-        if press == ButtonPress.SHORT:
+        if press is ButtonPress.SHORT:
             self._stop_recording()
-        elif press == ButtonPress.LONG:
+        elif press is ButtonPress.LONG:
             self._extend_recording()
 
     def _handle_button_processing(self, press: ButtonPress):
@@ -574,9 +593,8 @@ class RecorderService:
             return
 
         # Generate output filename with timestamp (includes milliseconds)
-        pending_dir = STORAGE_BASE_PATH / "pending"
-        pending_dir.mkdir(parents=True, exist_ok=True)
-        self.current_output_file = generate_filename(pending_dir, extension="mp4")
+        PENDING_DIR.mkdir(parents=True, exist_ok=True)
+        self.current_output_file = generate_filename(PENDING_DIR, extension="mp4")
 
         # Create recording session
         self.current_session = RecordingSession(camera_manager=self.camera)
@@ -601,7 +619,7 @@ class RecorderService:
             return
 
         # Success - transition to RECORDING
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         self._transition_to_recording()
 
         self.logger.info(f"Recording started: {self.current_output_file.name}")
@@ -643,7 +661,7 @@ class RecorderService:
         session.cleanup()  # Clean up monitoring thread and resources
 
         # Calculate recording duration
-        duration = time.time() - start_time if start_time else 0
+        duration = time.monotonic() - start_time if start_time else 0
 
         # Save to storage (this takes 2-3 seconds)
         try:
@@ -785,7 +803,8 @@ class RecorderService:
             video: VideoFile object to upload
         """
         self.logger.info(f"Queueing upload for: {video.filename}")
-        self.upload_queue.put(video)
+        self.upload_queue.append(video)
+        self._upload_wake.set()
 
     def _upload_worker(self):
         """
@@ -811,12 +830,12 @@ class RecorderService:
                     self._process_upload(video)
 
                 # Then process newly queued uploads
-                try:
-                    video = self.upload_queue.get(timeout=1.0)
-                    self._process_upload(video)
-                except queue.Empty:
-                    # No uploads in queue, wait and check again
+                if not self.upload_queue:
+                    # No uploads in queue, wait (or get woken) and check again
+                    self._upload_wake.wait(timeout=1.0)
+                    self._upload_wake.clear()
                     continue
+                self._process_upload(self.upload_queue.popleft())
 
             except Exception as e:
                 self.logger.error(f"Upload worker error: {e}", exc_info=True)
@@ -890,7 +909,7 @@ class RecorderService:
                     # Wait before retry (only if system is idle)
                     self._wait_for_retry(RETRY_DELAY_SECONDS)
                     # Re-queue for retry
-                    self.upload_queue.put(video)
+                    self.upload_queue.append(video)
                 else:
                     self.logger.error(
                         f"Upload failed permanently after "
@@ -921,9 +940,9 @@ class RecorderService:
             delay_seconds: How long to wait
         """
         self.logger.info(f"Waiting {delay_seconds}s before retry...")
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < delay_seconds:
+        while time.monotonic() - start_time < delay_seconds:
             if not self.running:
                 return  # Shutting down
 
@@ -931,7 +950,7 @@ class RecorderService:
             time.sleep(1)
 
         # After delay, wait until system is idle (not recording)
-        while self.state == SystemState.RECORDING:
+        while self.state is SystemState.RECORDING:
             if not self.running:
                 return
             time.sleep(1)
@@ -966,7 +985,7 @@ class RecorderService:
         while self.running:
             try:
                 # Wait until cleanup interval
-                time_since_last = time.time() - self.last_cleanup_time
+                time_since_last = time.monotonic() - self.last_cleanup_time
 
                 if time_since_last >= CLEANUP_INTERVAL_SECONDS:
                     self.logger.info("Running automatic cleanup...")
@@ -981,7 +1000,7 @@ class RecorderService:
                     else:
                         self.logger.debug("Cleanup complete: no videos to delete")
 
-                    self.last_cleanup_time = time.time()
+                    self.last_cleanup_time = time.monotonic()
 
                 # Sleep for 1 minute, then check again
                 time.sleep(60)
@@ -992,57 +1011,6 @@ class RecorderService:
 
         self.logger.info("Cleanup worker thread stopped")
 
-    # =========================================================================
-    # NETWORK MONITORING
-    # =========================================================================
-
-    def _start_network_monitor(self):
-        """Start background network monitoring thread."""
-        self.logger.info("Starting network monitor...")
-        self.network_monitor_thread = threading.Thread(
-            target=self._network_monitor_worker,
-            daemon=True,
-            name="NetworkMonitor",
-        )
-        self.network_monitor_thread.start()
-
-    def _network_monitor_worker(self):
-        """
-        Background worker for network connectivity monitoring.
-
-        Runs continuously:
-        - Checks internet connectivity every NETWORK_CHECK_INTERVAL seconds
-        - Updates WHITE LED status based on connectivity
-        - Silent operation - just tracks and updates LED
-        """
-        self.logger.info("Network monitor thread started")
-
-        while self.running:
-            try:
-                # Check internet connectivity
-                is_connected = check_internet_connectivity()
-
-                # Store status for metrics
-                self.internet_connected = is_connected
-
-                # Update WHITE LED status
-                self.led.set_network_status(is_connected)
-
-                # Log state changes for debugging
-                if is_connected:
-                    self.logger.debug("Internet: available")
-                else:
-                    self.logger.debug("Internet: unavailable")
-
-                # Sleep for the configured interval
-                time.sleep(NETWORK_CHECK_INTERVAL)
-
-            except Exception as e:
-                self.logger.error(f"Network monitor error: {e}", exc_info=True)
-                time.sleep(NETWORK_CHECK_INTERVAL)
-
-        self.logger.info("Network monitor thread stopped")
-
     # =========================================================================
     # STORAGE ERROR HANDLERS
     # =========================================================================
@@ -1155,9 +1123,8 @@ class RecorderService:
             self.logger.info("Waiting for cleanup worker to stop...")
             self.cleanup_worker_thread.join(timeout=5.0)
 
-        if self.network_monitor_thread and self.network_monitor_thread.is_alive():
-            self.logger.info("Waiting for network monitor to stop...")
-            self.network_monitor_thread.join(timeout=5.0)
+        self.logger.info("Waiting for network monitor to stop...")
+        self.network_monitor.stop(timeout=5.0)
 
         # Clean up hardware
         self.logger.info("Cleaning up hardware...")
@@ -1176,6 +1143,9 @@ def setup_logging():
     - Daily rotation
     - Keep 7 days of logs
     - Max 10MB per file
+
+    Handlers run on a background listener thread: logging calls only
+    enqueue the record, so no thread blocks on console/file I/O.
     """
     # Create logger
     logger = logging.getLogger()
@@ -1188,7 +1158,8 @@ def setup_logging():
         "%(message)s | %(name)s | %(levelname)s",
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)  # File handler with rotation
+
+    # File handler with rotation
     # Rotates daily, keeps 7 days
     # Define format once for both try and except blocks
     file_format = logging.Formatter(
@@ -1196,6 +1167,7 @@ def setup_logging():
     )
 
     log_file = "/var/log/recorder/service.log"
+    fallback_log: Optional[Path] = None
     try:
         file_handler = logging.handlers.TimedRotatingFileHandler(
             log_file,
@@ -1204,26 +1176,13 @@ def setup_logging():
             backupCount=7,
             encoding="utf-8",
         )
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
     except (PermissionError, FileNotFoundError):
         # Fallback to local logs directory if /var/log not writable
         # Create logs directory if it doesn't exist
-        from pathlib import Path
-
         logs_dir = Path("logs")
         logs_dir.mkdir(exist_ok=True)
 
         fallback_log = logs_dir / "recorder-service.log"
-        logger.warning(
-            f"Cannot write to {log_file}, using fallback: {fallback_log}",
-        )
-        logger.info(
-            "To fix: sudo mkdir -p /var/log/recorder && "
-            "sudo chown $(whoami) /var/log/recorder",
-        )
-
         file_handler = logging.handlers.TimedRotatingFileHandler(
             str(fallback_log),
             when="midnight",
@@ -1231,9 +1190,35 @@ def setup_logging():
             backupCount=7,
             encoding="utf-8",
         )
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(file_format)
+
+    # Loggers only enqueue; one listener thread does the writes
+    # WHY: the button worker logs right before dispatching each press, and
+    #   a slow write (SD card, midnight rotation) would delay the callback
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+
+    # Registered after logging's own exit hook, so it runs first: records
+    # still queued at exit are written before logging shuts down
+    atexit.register(listener.stop)
+
+    # Reported only now, once there is a handler to report it
+    if fallback_log is not None:
+        logger.warning(
+            f"Cannot write to {log_file}, using fallback: {fallback_log}",
+        )
+        logger.info(
+            "To fix: sudo mkdir -p /var/log/recorder && "
+            "sudo chown $(whoami) /var/log/recorder",
+        )
 
 
 def main():
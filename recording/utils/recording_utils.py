@@ -7,6 +7,7 @@ Extracted here to follow DRY (Don't Repeat Yourself) principle.
 
 import logging
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -238,8 +239,6 @@ def cleanup_old_recordings(
 
     # Delete by age if specified
     if max_age_days:
-        import time
-
         max_age_seconds = max_age_days * 24 * 60 * 60
         current_time = time.time()
 
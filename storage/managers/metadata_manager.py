@@ -8,11 +8,11 @@ Single responsibility: Database operations only.
 import logging
 import sqlite3
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-from config.settings import METADATA_DB_NAME
+from config.settings import MAX_UPLOAD_RETRIES, METADATA_DB_NAME
 from storage.constants import UploadStatus
 from storage.interfaces.storage_interface import StorageError
 from storage.models.video_file import VideoFile
@@ -444,8 +444,6 @@ class MetadataManager:
             cursor = conn.cursor()
 
             # Get failed videos that haven't exceeded retry limit
-            from config.settings import MAX_UPLOAD_RETRIES
-
             cursor.execute(
                 """
                 SELECT * FROM videos
@@ -476,8 +474,6 @@ class MetadataManager:
             cursor = conn.cursor()
 
             # Calculate cutoff date
-            from datetime import timedelta
-
             cutoff = datetime.now() - timedelta(days=days)
             cutoff_str = cutoff.isoformat()
 
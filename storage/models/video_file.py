@@ -9,6 +9,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from config.settings import (
+    LOW_SPACE_WARNING_BYTES,
+    MAX_UPLOAD_RETRIES,
+    MIN_FREE_SPACE_BYTES,
+)
 from storage.constants import UploadStatus, VideoQuality
 
 
@@ -80,8 +85,6 @@ class VideoFile:
     @property
     def can_retry(self) -> bool:
         """Check if video can be retried (failed but under retry limit)"""
-        from config.settings import MAX_UPLOAD_RETRIES
-
         return self.is_failed and self.upload_attempts < MAX_UPLOAD_RETRIES
 
     @property
@@ -220,15 +223,11 @@ class StorageStats:
     @property
     def is_low_space(self) -> bool:
         """Check if space is below warning threshold"""
-        from config.settings import LOW_SPACE_WARNING_BYTES
-
         return self.free_space_bytes < LOW_SPACE_WARNING_BYTES
 
     @property
     def is_disk_full(self) -> bool:
         """Check if space is below minimum threshold"""
-        from config.settings import MIN_FREE_SPACE_BYTES
-
         return self.free_space_bytes < MIN_FREE_SPACE_BYTES
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1 @@
+"""Core Module Tests"""
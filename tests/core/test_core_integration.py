@@ -0,0 +1,76 @@
+"""
+Core Module Integration Tests
+
+Focused tests following CLAUDE.md: simplicity first, top priorities only.
+
+Tests cover:
+1. Connectivity check result caching
+2. Background network monitor
+"""
+
+import threading
+
+import pytest
+
+from core import network
+from core.network import NetworkMonitor, check_internet_connectivity
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    """Replace the real network probe with a counting stub (always online)"""
+    calls = []
+
+    def fake_probe():
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(network, "_probe_connectivity", fake_probe)
+    monkeypatch.setattr(network, "_cache", network._CachedCheck())
+    return calls
+
+
+# =============================================================================
+# CONNECTIVITY TESTS
+# =============================================================================
+
+
+class TestConnectivityCheck:
+    """Test check_internet_connectivity caching"""
+
+    def test_result_is_cached(self, probe_calls):
+        """Repeated checks within the TTL reuse the first probe"""
+        assert check_internet_connectivity() is True
+        assert check_internet_connectivity() is True
+
+        assert len(probe_calls) == 1
+
+    def test_force_bypasses_cache(self, probe_calls):
+        """force=True always probes the network"""
+        check_internet_connectivity()
+        check_internet_connectivity(force=True)
+
+        assert len(probe_calls) == 2
+
+
+class TestNetworkMonitor:
+    """Test NetworkMonitor background status"""
+
+    def test_monitor_reports_status(self, probe_calls):
+        """Monitor publishes the probe result via is_online and on_check"""
+        checked = threading.Event()
+        monitor = NetworkMonitor(interval=60)
+        monitor.on_check = lambda _online: checked.set()
+
+        assert monitor.is_online() is False
+
+        monitor.start()
+        try:
+            assert checked.wait(timeout=2.0)
+            assert monitor.is_online() is True
+        finally:
+            monitor.stop(timeout=2.0)
@@ -19,7 +19,7 @@ from hardware.constants import AudioMessage
 from hardware.controllers.audio_controller import AudioController
 
 # Import controllers
-from hardware.controllers.button_controller import ButtonController
+from hardware.controllers.button_controller import ButtonController, ButtonPress
 from hardware.controllers.led_controller import LEDController, LEDPattern
 
 # Import factory
@@ -32,6 +32,24 @@ from hardware.implementations.mock_tts import MockTTS
 # Import GPIO enums
 from hardware.interfaces.gpio_interface import PinState, PullMode
 
+# Import pattern utilities
+from hardware.utils import PatternParseError, compile_pattern
+
+# Contact bounce on a pull-up button: the level chatters, then settles
+# WHY these timings: edges further apart than the GPIO bouncetime reach the
+#   controller, but closer together than its (raised) settle_time, so the
+#   controller's own settle logic is what has to collapse them
+_TEST_SETTLE_TIME = 0.08
+_BOUNCE_INTERVAL = 0.02
+_BOUNCE_TO_PRESSED = (
+    PinState.LOW,
+    PinState.HIGH,
+    PinState.LOW,
+    PinState.HIGH,
+    PinState.LOW,
+)
+_BOUNCE_TO_RELEASED = (PinState.HIGH, PinState.LOW, PinState.HIGH)
+
 
 class TestMockImplementations:
     """Test mock implementations work correctly"""
@@ -96,6 +114,77 @@ class TestButtonController:
         assert callback_called
         button.cleanup()
 
+    def test_button_bounce_collapses_to_one_press(self):
+        """A burst of bounce edges on press and release is one SHORT press"""
+        gpio = MockGPIO()
+        button = ButtonController(gpio=gpio, pin=18)
+        button.settle_time = _TEST_SETTLE_TIME
+        presses = []
+        button.register_callback(presses.append)
+
+        for state in _BOUNCE_TO_PRESSED:
+            gpio.simulate_edge(18, state)
+            time.sleep(_BOUNCE_INTERVAL)
+        time.sleep(0.2)  # Held, well under the long press threshold
+        for state in _BOUNCE_TO_RELEASED:
+            gpio.simulate_edge(18, state)
+            time.sleep(_BOUNCE_INTERVAL)
+        time.sleep(0.2)
+
+        assert presses == [ButtonPress.SHORT]
+        button.cleanup()
+
+    def test_button_ignores_glitch_shorter_than_settle_time(self):
+        """A low pulse shorter than settle_time is not a press"""
+        gpio = MockGPIO()
+        button = ButtonController(gpio=gpio, pin=18)
+        button.settle_time = _TEST_SETTLE_TIME
+        presses = []
+        button.register_callback(presses.append)
+
+        gpio.simulate_edge(18, PinState.LOW)
+        time.sleep(_BOUNCE_INTERVAL)
+        gpio.simulate_edge(18, PinState.HIGH)
+        time.sleep(0.2)
+
+        assert presses == []
+        assert button.get_status()["button_is_pressed"] is False
+        button.cleanup()
+
+    def test_button_long_press_fires_while_held(self):
+        """LONG fires at the threshold, and the release adds nothing"""
+        gpio = MockGPIO()
+        button = ButtonController(gpio=gpio, pin=18)
+        button.long_press_duration = 0.2
+        presses = []
+        button.register_callback(presses.append)
+
+        gpio.simulate_edge(18, PinState.LOW)
+        time.sleep(0.4)
+        assert presses == [ButtonPress.LONG]  # Still held
+
+        gpio.simulate_edge(18, PinState.HIGH)
+        time.sleep(0.1)
+
+        assert presses == [ButtonPress.LONG]
+        button.cleanup()
+
+    def test_button_release_after_long_deadline_is_not_short(self):
+        """Releasing just past the threshold gives one LONG and no SHORT"""
+        gpio = MockGPIO()
+        button = ButtonController(gpio=gpio, pin=18)
+        button.long_press_duration = 0.2
+        presses = []
+        button.register_callback(presses.append)
+
+        gpio.simulate_edge(18, PinState.LOW)
+        time.sleep(0.2 + button.settle_time)
+        gpio.simulate_edge(18, PinState.HIGH)
+        time.sleep(0.1)
+
+        assert presses == [ButtonPress.LONG]
+        button.cleanup()
+
 
 class TestLEDController:
     """Test LED controller basics"""
@@ -124,6 +213,21 @@ class TestLEDController:
         led.cleanup()
 
 
+class TestPatternParser:
+    """Test LED pattern compilation"""
+
+    def test_compile_pattern_to_masks(self):
+        """Pattern steps compile to G/O/R bitmasks"""
+        masks = compile_pattern("G-O-R-GOR-x-x-G-O-R-GOR-x-_")
+
+        assert masks == (1, 2, 4, 7, 0, 0, 1, 2, 4, 7, 0, 0)
+
+    def test_compile_pattern_rejects_invalid(self):
+        """Invalid patterns raise PatternParseError"""
+        with pytest.raises(PatternParseError):
+            compile_pattern("G-O-R")
+
+
 class TestAudioController:
     """Test audio controller basics"""
 
@@ -151,6 +255,134 @@ class TestAudioController:
 
         audio.cleanup()
 
+    def test_audio_wait_until_idle(self):
+        """wait_until_idle returns once queued messages are spoken"""
+        tts = MockTTS(simulate_timing=False)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_text("First")
+        audio.play_text("Second")
+
+        assert audio.wait_until_idle(timeout=2.0) is True
+        assert len(tts.speech_history) == 2
+        assert audio.is_busy() is False
+
+        audio.cleanup()
+
+    def test_audio_mute(self):
+        """Muted controller drops messages without speaking them"""
+        tts = MockTTS(simulate_timing=False)
+        audio = AudioController(tts_engine=tts)
+
+        audio.mute()
+        audio.play_message(AudioMessage.SYSTEM_READY)
+        audio.play_text("Ignored")
+
+        assert audio.is_busy() is False
+        assert len(tts.speech_history) == 0
+
+        audio.unmute()
+        audio.play_text("Spoken")
+        assert audio.wait_until_idle(timeout=2.0) is True
+        assert len(tts.speech_history) == 1
+
+        audio.cleanup()
+
+    def test_audio_prewarms_predefined_messages(self):
+        """Every predefined message is pre-rendered on the audio worker"""
+        tts = MockTTS(simulate_timing=False)
+        rendered = []
+        tts.prerender = rendered.append
+        audio = AudioController(tts_engine=tts)
+
+        expected = len(audio.message_library)
+        deadline = time.monotonic() + 2.0
+        while len(rendered) < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(rendered) == expected
+        assert AudioMessage.SYSTEM_READY.text in rendered
+        assert tts.speech_history == []  # Pre-rendering never speaks
+
+        audio.cleanup()
+
+    def test_audio_coalesces_repeated_messages(self):
+        """A repeat of a still-queued message is not spoken twice"""
+        tts = MockTTS(simulate_timing=True)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_text("Busy")
+        audio.play_text("Repeat")
+        audio.play_text("Repeat")
+        audio.play_text("Done")
+
+        assert audio.wait_until_idle(timeout=5.0) is True
+        assert tts.speech_history == ["Busy", "Repeat", "Done"]
+
+        audio.cleanup()
+
+    def test_audio_speaks_repeated_sentence_within_text(self):
+        """A sentence repeated inside one text is spoken every time"""
+        tts = MockTTS(simulate_timing=False)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_text("Warning. Warning.")
+
+        assert audio.wait_until_idle(timeout=5.0) is True
+        assert tts.speech_history == ["Warning.", "Warning."]
+
+        audio.cleanup()
+
+    def test_audio_drops_repeat_of_playing_message(self):
+        """A repeat of the message being spoken right now is dropped"""
+        tts = MockTTS(simulate_timing=True)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_message(AudioMessage.UPLOAD_FAILED)
+        time.sleep(0.05)  # Let the worker start speaking it
+        audio.play_message(AudioMessage.UPLOAD_FAILED)
+
+        assert audio.wait_until_idle(timeout=5.0) is True
+        assert tts.speech_history == [AudioMessage.UPLOAD_FAILED.text]
+
+        audio.cleanup()
+
+    def test_audio_rate_limits_error_messages(self):
+        """An error announced again within its interval is dropped"""
+        tts = MockTTS(simulate_timing=False)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_message(AudioMessage.SYSTEM_ERROR)
+        assert audio.wait_until_idle(timeout=5.0) is True
+
+        # Already spoken (not coalesced), but still within the interval
+        audio.play_message(AudioMessage.SYSTEM_ERROR)
+        audio.play_message(AudioMessage.UPLOAD_FAILED)  # Not rate limited
+
+        assert audio.wait_until_idle(timeout=5.0) is True
+        assert tts.speech_history == [
+            AudioMessage.SYSTEM_ERROR.text,
+            AudioMessage.UPLOAD_FAILED.text,
+        ]
+
+        audio.cleanup()
+
+    def test_audio_speaks_text_sentence_by_sentence(self):
+        """Multi-sentence text is queued as one utterance per sentence"""
+        tts = MockTTS(simulate_timing=False)
+        audio = AudioController(tts_engine=tts)
+
+        audio.play_text("Recording saved. Uploading now!  Please wait? ")
+
+        assert audio.wait_until_idle(timeout=5.0) is True
+        assert tts.speech_history == [
+            "Recording saved.",
+            "Uploading now!",
+            "Please wait?",
+        ]
+
+        audio.cleanup()
+
 
 class TestHardwareFactory:
     """Test hardware factory"""